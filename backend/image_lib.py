@@ -5,17 +5,39 @@
 
 #                                           === Backend ===
 
-from array import array
-from typing import Any, Sequence, Tuple, TypeAlias
+import importlib.util
+import os
+import struct
+from functools import lru_cache
+from typing import Any, Optional, Sequence, Tuple, TypeAlias
 
 from PIL import Image as _PIL
 from PIL.Image import Image as PILImage
 from PIL import Image as PILImageModule
 from PIL import ImageChops
 
+from settings import IMAGE_BACKEND
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+# Numpy is optional (required only for the .exr support); used to vectorize pixel operations when available.
+
+try:
+    import numba
+except ImportError:
+    numba = None
+# Numba is optional; JIT-compiles the per-pixel kernels on top of Numpy when available.
+
 ImageObject: TypeAlias = PILImage
 
 
+def get_backend_version() -> str:
+# Returns the image backend name and version; Pillow-SIMD builds are versioned as ".postN".
+    return f"Pillow {_PIL.__version__}"
+
+
 def close_image(image: object) -> None:
     close = getattr(image, "close", None)
     if callable(close):
@@ -58,8 +80,91 @@ def new_image_grayscale(size: Tuple[int, int], fill: int) -> Any:
     return _PIL.new("L", size, fill)
 
 
-def open_image(path: str) -> ImageObject:
-    return _PIL.open(path)
+def open_image(path: str, draft_size: Optional[Tuple[int, int]] = None, draft_grayscale: bool = False) -> ImageObject:
+# Opens the image lazily. With a draft size, .jpeg files are decoded by libjpeg at the smallest 1/2, 1/4 or 1/8 scale still covering it (and straight to grayscale if requested); other formats ignore the draft.
+    image = _PIL.open(path)
+    # Pillow owns the file it opens from a path and closes it once the pixels are loaded, so the source isn't held open until the image is closed, e.g., blocking it from being moved to the backup folder on Windows.
+    if draft_size is not None:
+        image.draft("L" if draft_grayscale else image.mode, draft_size)
+    return image
+
+
+def load_image(image: ImageObject) -> None:
+# Decodes the pixel data of a lazily opened image.
+    image.load()
+
+
+def pack_channels(mode: str, sources: Sequence[Tuple[ImageObject, str]]) -> ImageObject:
+# Packs one channel of each source image into a single image, e.g., [(normal, "R"), (normal, "G"), (height, "L")].
+# Pillow extracts and merges the bands in its own buffers; going through Numpy arrays is slower, as both converting to and from an array copy the whole image.
+    return merge_channels(mode, [image if channel == "L" else get_channel(image, channel) for image, channel in sources])
+
+
+def probe_image(path: str) -> Tuple[str, Tuple[int, int], Tuple[str, ...]]:
+# Returns the image (mode, size, channels) read from the file header.
+# Cached per path and modification time, so repeated probes of the same file don't parse the header again, while re-saved files are read anew.
+    return _probe_image(path, os.stat(path).st_mtime_ns)
+
+
+@lru_cache(maxsize=4096)
+def _probe_image(path: str, _mtime_ns: int) -> Tuple[str, Tuple[int, int], Tuple[str, ...]]:
+    with _PIL.open(path) as image:
+        return image.mode, image.size, image.getbands()
+
+
+def probe_image_size(path: str) -> Tuple[int, int]:
+# Returns the image size as (width, height). For .png and .jpeg reads only the few header bytes holding it, without setting up a decoder.
+# Other formats, or files whose header can't be parsed this way, fall back to probe_image.
+# Cached per path, modification time and file size, so a texture used by multiple packing modes is read once.
+    file_stat = os.stat(path)
+    return _probe_image_size(path, file_stat.st_mtime_ns, file_stat.st_size)
+
+
+@lru_cache(maxsize=4096)
+def _probe_image_size(path: str, _mtime_ns: int, _file_size: int) -> Tuple[int, int]:
+    try:
+        with open(path, "rb") as file:
+            header = file.read(26)
+            if header.startswith(b"\x89PNG\r\n\x1a\n") and header[12:16] == b"IHDR":
+                return struct.unpack(">II", header[16:24])
+            if header.startswith(b"\xff\xd8"):
+                file.seek(2)
+                size = _read_jpeg_size(file)
+                if size is not None:
+                    return size
+    except (OSError, struct.error):
+        pass
+    return probe_image(path)[1]
+
+
+_JPEG_SOF_MARKERS: frozenset[int] = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC} # Start of frame markers; 0xC4, 0xC8, 0xCC are DHT, JPG, DAC.
+
+
+def _read_jpeg_size(file: Any) -> Optional[Tuple[int, int]]:
+# Walks the JPEG segments up to the first start of frame, which stores the image height and width.
+
+    while True:
+        byte = file.read(1)
+        while byte and byte != b"\xff":
+            byte = file.read(1)
+        while byte == b"\xff":
+            byte = file.read(1)
+        # Skips to the next marker, including any 0xFF fill bytes before it.
+        if not byte:
+            return None
+
+        marker = byte[0]
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8:
+            continue
+        # Standalone markers carry no segment length.
+        if marker == 0xD9:
+            return None
+
+        segment_length: int = struct.unpack(">H", file.read(2))[0]
+        if marker in _JPEG_SOF_MARKERS:
+            height, width = struct.unpack(">xHH", file.read(5))
+            return width, height
+        file.seek(segment_length - 2, os.SEEK_CUR)
 
 
 def resize(image: ImageObject, size: Tuple[int, int]) -> ImageObject:
@@ -67,8 +172,12 @@ def resize(image: ImageObject, size: Tuple[int, int]) -> ImageObject:
     return image.resize(size, _PIL.BILINEAR)
 
 
-def save_image(image: Any, path: str) -> None:
-    image.save(path)
+def save_image(image: Any, path: str, quality: Optional[int] = None) -> None:
+# Saves the image; the file format is derived from the extension. Quality applies only to lossy formats (jpeg).
+    if quality is not None:
+        image.save(path, quality=quality, optimize=True)
+    else:
+        image.save(path)
 
 
 
@@ -88,25 +197,49 @@ def are_channels_equal(image: ImageObject, input_channel1: str, input_channel2:
 # Returns True if both channels are identical.
 
     try:
+        bands = get_image_channels(image)
+        extrema = image.getextrema()
+        index1, index2 = bands.index(input_channel1.upper()), bands.index(input_channel2.upper())
+        if len(bands) > 1 and extrema[index1] != extrema[index2]:
+            return False
+        # Pre-validation: channels with different extremes can't be equal, skips allocating the difference image.
+
         channel1 = get_channel(image, input_channel1)
         channel2 = get_channel(image, input_channel2)
-        return ImageChops.difference(channel1, channel2).getbbox() is None
+        return ImageChops.difference(channel1, channel2).getextrema()[1] == 0
     except Exception:
         return False
 
 
+_GRAYSCALE_SAMPLE_STEP: int = 16 # Every 16th pixel in both directions is sampled before the full grayscale check.
+
+
 def is_rgb_grayscale(image: ImageObject) -> bool:
 # Checks if RGB texture is just a grayscale image saved as RGB instead of L.
 
+    if get_image_mode(image) not in ("RGB", "RGBA"):
+        return False
+
+    if np is not None:
+        pixels = np.asarray(image)
+        sample = pixels[::_GRAYSCALE_SAMPLE_STEP, ::_GRAYSCALE_SAMPLE_STEP]
+        if np.any((sample[..., 0] ^ sample[..., 1]) | (sample[..., 1] ^ sample[..., 2])):
+            return False
+        # Pre-validation: checks a strided subsample of the array first, so color textures are rejected without the full comparison pass; the array itself is still a full copy of the image.
+        green = pixels[..., 1]
+        return not np.any((pixels[..., 0] ^ green) | (green ^ pixels[..., 2]))
+    # Compares the channels directly on the pixel buffer in a single fused pass when Numpy is available; any differing bit marks a color pixel.
+
     try:
-        ext = image.getextrema()  # (Rmin,Rmax),(Gmin,Gmax),(Bmin,Rmax),(Amin,Amax)
-        if not ext or len(ext) < 2 or ext[0] != ext[1]:
+        ext = image.getextrema()  # (Rmin,Rmax),(Gmin,Gmax),(Bmin,Bmax),(Amin,Amax)
+        if not ext or len(ext) < 3 or ext[0] != ext[1] or ext[1] != ext[2]:
             return False
         # Pre-validation: checks if the channels extremes are the same.
 
     except Exception:
         pass
-    return are_channels_equal(image, "R", "G")
+    return are_channels_equal(image, "R", "G") and are_channels_equal(image, "G", "B")
+    # All three channels must match; e.g., a tint with R == G but a different B is a color image.
 
 
 def convert_to_grayscale(image: ImageObject) -> ImageObject:
@@ -117,25 +250,55 @@ def convert_to_grayscale(image: ImageObject) -> ImageObject:
     if mode in ("I", "I;16", "I;16L", "I;16B"):
         return _16_to_8bit(image)
     return image.convert("L")
+    # No separate path for grayscale saved as RGB: Pillow's luminance weights sum to 1, so it already returns the R channel unchanged, faster than checking the channels first.
+
+
+if numba is not None and np is not None:
+    @numba.njit(parallel=True, cache=True, fastmath=True)
+    def _shift16_to_8(src_u16: Any, dst_u8: Any) -> None:
+    # Writes the high byte of each 16bit value into the 8bit buffer, split across the CPU cores.
+        for i in numba.prange(src_u16.shape[0]):
+            dst_u8[i] = src_u16[i] >> 8
+else:
+    _shift16_to_8 = None
 
 
 def _16_to_8bit(image: ImageObject) -> ImageObject:
 # Scales down 16bit range to a 8bit, so values are properly maintained instead of being clipped.
 
 # Preparing the image:
-    if image.mode == "I":
-        img16 = image.convert("I;16")
-    elif image.mode in ("I;16", "I;16L", "I;16B"):
-        img16 = image if image.mode == "I;16" else image.convert("I;16")
-    # Normalizes the image type to 16bit LE.
+    if image.mode in ("I;16", "I;16L"):
+        img16, high_byte_offset, data16_type = image, 1, "<u2"
+    elif image.mode == "I;16B":
+        img16, high_byte_offset, data16_type = image, 0, ">u2"
+    # 16bit images are read in their own byte order, without converting big-endian ones first.
+    elif image.mode == "I":
+        img16, high_byte_offset, data16_type = image.convert("I;16"), 1, "<u2"
+    # Normalizes the 32bit image type to 16bit LE.
     else:
         return image.convert("L")
     # If the image is just 8bit grayscale, passes it though.
 
-    raw = img16.tobytes("raw", "I;16")  # LE 16bit
-    data16 = array("H")
-    data16.frombytes(raw)
+    raw = img16.tobytes()  # 16bit in the image's byte order
 
 # Scaling:
-    data8 = bytearray((v >> 8) & 0xFF for v in data16)
-    return PILImageModule.frombytes("L", img16.size, bytes(data8))
\ No newline at end of file
+    if np is not None and _shift16_to_8 is not None and np.dtype(data16_type).isnative:
+        data16_np = np.frombuffer(raw, dtype=data16_type)
+        data8_np = np.empty(data16_np.shape[0], dtype=np.uint8)
+        _shift16_to_8(data16_np, data8_np)
+        return PILImageModule.frombuffer("L", img16.size, data8_np, "raw", "L", 0, 1)
+    # Uses the Numba kernel if it's installed; it handles only the native byte order.
+    # The image shares memory with the contiguous output array (Pillow keeps it referenced), skipping a copy through bytes.
+
+    return PILImageModule.frombytes("L", img16.size, raw[high_byte_offset::2])
+    # The high byte of each 16bit value is every second byte of the buffer (odd ones for LE, even ones for BE), so it's sliced directly without unpacking the values.
+
+
+
+
+
+#                                           === Backend selection ===
+
+if IMAGE_BACKEND == "vips" and importlib.util.find_spec("pyvips") is not None:
+    from backend.image_lib_vips import *
+# Replaces the Pillow implementation with the libvips one if selected in the config and pyvips is installed.
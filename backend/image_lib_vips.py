@@ -0,0 +1,186 @@
+
+""" Image processing backend implemented using libvips (pyvips). Selected with IMAGE_BACKEND: "vips" in the config, otherwise Pillow is used."""
+#  Mirrors the public functions of image_lib, so it's a drop-in replacement; images are opened lazily and pixels are decoded only when the packed result is written.
+#  tga files are decoded with Pillow, as libvips can only load them through ImageMagick.
+
+
+
+#                                           === Backend ===
+
+import os
+from functools import lru_cache
+from typing import Any, Optional, Sequence, Tuple, TypeAlias
+
+import pyvips
+
+ImageObject: TypeAlias = pyvips.Image
+
+__all__ = ["ImageObject", "get_backend_version", "close_image", "from_array_u8", "get_channel", "get_image_channels", "get_image_mode", "get_size", "load_image",
+           "merge_channels", "new_image_grayscale", "open_image", "pack_channels", "probe_image", "probe_image_size", "resize", "save_image",
+           "is_grayscale", "are_channels_equal", "is_rgb_grayscale", "convert_to_grayscale"]
+
+
+_CHANNEL_NAMES: dict[int, Tuple[str, ...]] = {1: ("L",), 2: ("L", "A"), 3: ("R", "G", "B"), 4: ("R", "G", "B", "A")} # Pillow-like channel names by the number of bands.
+_INTERPRETATIONS: dict[str, str] = {"L": "b-w", "RGB": "srgb", "RGBA": "srgb"}
+_PILLOW_LOADED_EXTENSIONS: Tuple[str, ...] = (".tga",) # Formats libvips can't load without ImageMagick.
+
+
+def get_backend_version() -> str:
+# Returns the image backend name and version.
+    return f"libvips {pyvips.version(0)}.{pyvips.version(1)}.{pyvips.version(2)}"
+
+
+def close_image(image: object) -> None:
+# libvips images are reference counted and have no file handle to close; kept for interface compatibility.
+    close = getattr(image, "close", None)
+    if callable(close):
+        close()
+
+
+def from_array_u8(data: Any, mode: str) -> ImageObject:
+# Creates an image from a uint8 numpy array.
+    height, width = data.shape[:2]
+    bands = 1 if data.ndim == 2 else data.shape[2]
+    image = pyvips.Image.new_from_memory(data.tobytes(), width, height, bands, "uchar")
+    return image.copy(interpretation=_INTERPRETATIONS.get(mode, "multiband"))
+
+
+def get_channel(image: ImageObject, ch: str) -> ImageObject:
+# Extracts a single channel by name ("R","G","B","A","L")
+    return image.extract_band(get_image_channels(image).index(ch.upper()))
+
+
+def get_image_channels(image: ImageObject) -> Tuple[str, ...]:
+# Returns the channel names for an already open image, named the same way as in Pillow: ("R","G","B"), ("R","G","B","A"), ("L",)
+    return _CHANNEL_NAMES.get(image.bands, tuple(str(band) for band in range(image.bands)))
+
+
+def get_image_mode(image: Any) -> str:
+# Return the Pillow-like image mode: "RGB", "RGBA", "L", "LA", "I;16"
+    if image.bands == 1 and image.format in ("ushort", "short"):
+        return "I;16"
+    if image.bands == 1 and image.format in ("uint", "int"):
+        return "I"
+    return "".join(get_image_channels(image))
+
+
+def get_size(image: ImageObject) -> Tuple[int, int]:
+# Returns the image size as (width, height)
+    return image.width, image.height
+
+
+def load_image(image: ImageObject) -> None:
+# libvips computes pixels on demand while streaming the pipeline; kept for interface compatibility.
+    pass
+
+
+def merge_channels(mode: str, channels: Sequence[Any]) -> ImageObject:
+# Merge separate channels into a single image.
+    merged = channels[0].bandjoin(list(channels[1:])) if len(channels) > 1 else channels[0]
+    return merged.copy(interpretation=_INTERPRETATIONS.get(mode, "multiband"))
+
+
+def new_image_grayscale(size: Tuple[int, int], fill: int) -> Any:
+# Create a new grayscale image.
+    width, height = size
+    return pyvips.Image.black(width, height).new_from_image(fill).copy(interpretation="b-w")
+
+
+def open_image(path: str, draft_size: Optional[Tuple[int, int]] = None, draft_grayscale: bool = False) -> ImageObject:
+# libvips decodes on demand while streaming the pipeline, so the draft hints are accepted only for interface compatibility.
+    image = _new_from_file(path)
+    if image.bands >= 3 and image.format in ("ushort", "short"):
+        image = (image.cast("ushort") >> 8).cast("uchar").copy(interpretation="srgb")
+    # Narrows 16bit RGB to 8bit like Pillow does, so packed channels share one format when joined with 8bit sources.
+    return image
+
+
+def _new_from_file(path: str) -> ImageObject:
+# Opens the file with libvips, or decodes it with Pillow for formats libvips can't load on its own.
+    if not path.lower().endswith(_PILLOW_LOADED_EXTENSIONS):
+        return pyvips.Image.new_from_file(path)
+    from PIL import Image as _PIL
+    with _PIL.open(path) as pil_image:
+        if pil_image.mode not in ("L", "LA", "RGB", "RGBA"):
+            pil_image = pil_image.convert("RGBA" if "A" in pil_image.getbands() or "transparency" in pil_image.info else "RGB")
+        image = pyvips.Image.new_from_memory(pil_image.tobytes(), pil_image.width, pil_image.height, len(pil_image.getbands()), "uchar")
+    return image.copy(interpretation=_INTERPRETATIONS.get(pil_image.mode, "b-w"))
+
+
+def pack_channels(mode: str, sources: Sequence[Tuple[ImageObject, str]]) -> ImageObject:
+# Packs one channel of each source image into a single image, e.g., [(normal, "R"), (normal, "G"), (height, "L")].
+    return merge_channels(mode, [image if channel == "L" else get_channel(image, channel) for image, channel in sources])
+
+
+def probe_image(path: str) -> Tuple[str, Tuple[int, int], Tuple[str, ...]]:
+# Returns the image (mode, size, channels) read from the file header; libvips loads images lazily, so pixels aren't decoded.
+    return _probe_image(path, os.stat(path).st_mtime_ns)
+
+
+@lru_cache(maxsize=4096)
+def _probe_image(path: str, _mtime_ns: int) -> Tuple[str, Tuple[int, int], Tuple[str, ...]]:
+    image = _new_from_file(path)
+    return get_image_mode(image), get_size(image), get_image_channels(image)
+
+
+def probe_image_size(path: str) -> Tuple[int, int]:
+# Returns the image size as (width, height); shares the header cache with probe_image.
+    return probe_image(path)[1]
+
+
+def resize(image: ImageObject, size: Tuple[int, int]) -> ImageObject:
+# Resize an image using bilinear resampling.
+    width, height = size
+    return image.resize(width / image.width, vscale=height / image.height, kernel="linear")
+
+
+def save_image(image: Any, path: str, quality: Optional[int] = None) -> None:
+    if quality is not None:
+        image.write_to_file(path, Q=quality)
+    else:
+        image.write_to_file(path)
+
+
+
+
+#                                           === Utils ===
+
+
+
+def is_grayscale(image: ImageObject) -> bool:
+# Returns True if the image is of type grayscale image.
+    return get_image_mode(image) in ("L", "LA", "I", "I;16")
+
+
+def are_channels_equal(image: ImageObject, input_channel1: str, input_channel2: str) -> bool:
+# Returns True if both channels are identical.
+
+    try:
+        return (get_channel(image, input_channel1) == get_channel(image, input_channel2)).min() == 255
+    except Exception:
+        return False
+
+
+def is_rgb_grayscale(image: ImageObject) -> bool:
+# Checks if RGB texture is just a grayscale image saved as RGB instead of L.
+
+    if get_image_mode(image) not in ("RGB", "RGBA"):
+        return False
+    red = image.extract_band(0)
+    return ((red == image.extract_band(1)) & (red == image.extract_band(2))).min() == 255
+
+
+def convert_to_grayscale(image: ImageObject) -> ImageObject:
+# Converts an image to 8-bit grayscale.
+    mode = get_image_mode(image)
+    if mode == "L":
+        return image
+    if mode in ("I", "I;16"):
+        return (image.cast("ushort") >> 8).cast("uchar").copy(interpretation="b-w")
+    # Scales down 16bit range to a 8bit, so values are properly maintained instead of being clipped.
+    if mode in ("RGB", "RGBA") and is_rgb_grayscale(image):
+        return image.extract_band(0)
+    # Grayscale saved as RGB: takes a single channel, instead of computing luminance for each pixel.
+    if image.bands >= 3:
+        return image.extract_band(0, n=3).colourspace("b-w").cast("uchar")
+    return image.extract_band(0).cast("uchar").copy(interpretation="b-w")
@@ -2,17 +2,21 @@
 """ Input processing backend: unifies system CLI and Unreal Engine, so the main channel_packer logic is platform-agnostic. """
 #  It is now split into two separate packages but still allows the channel_packer function to be used interchangeably between them.
 
+import errno
 import os
 
 import shutil
-from typing import Dict, List, Set, Optional
-from collections import defaultdict
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, Iterable, List, Set, Optional, Tuple
+from collections import deque
 from dataclasses import dataclass, field
+from functools import lru_cache
 
-from backend.image_lib import (ImageObject, save_image as save_image_file)
+from backend.image_lib import (ImageObject, close_image, save_image as save_image_file)
 
 from settings import (ALLOWED_FILE_TYPES, BACKUP_FOLDER_NAME, DELETE_USED, TARGET_FOLDER_NAME, EXR_SRGB_CURVE, FILE_TYPE, SHOW_DETAILS)
-from utils import (check_exr_libraries, convert_exr_to_image, log)
+from utils import (capture_logs, check_exr_libraries, convert_exr_to_image, get_captured_log_lines, log)
 
 
 @dataclass
@@ -25,12 +29,26 @@ class ConvertedEXRImage:
 class CPContext:
     input_folder: Optional[str] = None
     work_directory: str = "" # Absolute path for a temporary folder.
-    selection_paths_map: Dict[str, str] = field(default_factory=dict) # Maps paths relative to the root directory to their absolute file paths.
+    selection_relative_paths: List[str] = field(default_factory=list) # Paths relative to the root directory of the files selected for processing, in order.
+    selection_paths_map: Dict[str, str] = field(default_factory=dict) # Maps selected relative paths to their absolute file paths; holds only the entries resolved by prepare_workspace.
     export_extension: str = "png" # Validated file extension set in config.
     textures_converted_from_raw: Dict[str, ConvertedEXRImage] = field(default_factory=dict)  # Collection of temporary converted .exr files for processing in the main module, their raw_source path, texture set name and its texture type.
+    scanned_source_files: Dict[str, Tuple[str, str]] = field(default_factory=dict) # Maps relative paths found by list_initial_files to their (absolute path, lowercase extension).
+    pending_saves: List[Future] = field(default_factory=list) # Generated textures queued for saving on a background thread.
 
 
 RAW_SOURCE_TYPES: tuple[str] = (".exr",)  # Makes .exr file discoverable by the script additionally to the "regular" file format types.
+SOURCE_FILE_EXTENSIONS: frozenset[str] = frozenset((extension if extension.startswith(".") else f".{extension}").lower() for extension in ALLOWED_FILE_TYPES + RAW_SOURCE_TYPES) # Lowercase, dotted extensions of all discoverable files.
+BLOCKED_FOLDER_NAMES: frozenset[str] = frozenset(folder_name.strip() for folder_name in (TARGET_FOLDER_NAME, BACKUP_FOLDER_NAME) if folder_name and folder_name.strip()) # Output/backup folders excluded from processing.
+ALLOWED_FILE_TYPES_DISPLAY: str = ", ".join(sorted(ALLOWED_FILE_TYPES)) # Supported output types listed in logs.
+
+_BACKSLASH_TO_SLASH: Dict[int, str] = str.maketrans({"\\": "/"})
+
+_backup_directory_listing: Dict[str, Set[str]] = {} # File names present in each backup folder, listed on the first move into it.
+
+_POOL_WORKERS: int = os.cpu_count() or 1
+_worker_pool: Optional[ThreadPoolExecutor] = None # Shared by the EXR conversion, saving and cleanup; created on first use, shut down in cleanup.
+_save_slots: threading.BoundedSemaphore = threading.BoundedSemaphore(_POOL_WORKERS * 2) # Caps the number of images waiting to be saved.
 
 
 
@@ -44,17 +62,9 @@ def context_validate_export_extension(context: "CPContext" = None) -> None:
 # Validates and sets in context extension input by the user in config.
 # Sets the extension type, without the dot.
 
-    allowed_file_types: set[str] = set(ALLOWED_FILE_TYPES)
-    typed_extension: str = (FILE_TYPE or "").strip().lower().lstrip(".")
-
-    if typed_extension == "jpg":
-        file_extension: str = "jpeg"
-    else:
-        file_extension: str = typed_extension
-
-    if not file_extension or file_extension not in allowed_file_types:
-        sorted_allowed_file_types = ", ".join(sorted(allowed_file_types))
-        log(f"Aborted: Invalid FILE_TYPE '{FILE_TYPE}'. Supported: {sorted_allowed_file_types}", "error")
+    file_extension: str = _resolve_export_extension(FILE_TYPE, ALLOWED_FILE_TYPES)
+    if not file_extension:
+        log(f"Aborted: Invalid FILE_TYPE '{FILE_TYPE}'. Supported: {ALLOWED_FILE_TYPES_DISPLAY}", "error")
         raise SystemExit(1)
 
     if context is not None:
@@ -62,38 +72,51 @@ def context_validate_export_extension(context: "CPContext" = None) -> None:
     return
 
 
+@lru_cache(maxsize=1)
+def _resolve_export_extension(file_type: str, allowed_file_types: tuple[str, ...]) -> str:
+# Normalizes the file type set in config; returns an empty string if it's not supported.
+# Cached, as the config doesn't change between runs when the packer is called repeatedly.
+
+    typed_extension: str = (file_type or "").strip().lower().lstrip(".")
+    file_extension: str = "jpeg" if typed_extension == "jpg" else typed_extension
+    return file_extension if file_extension in allowed_file_types else ""
+
+
 def split_by_parent(context: "CPContext") -> Dict[str, List[str]]:
 # Groups absolute paths from context.selection_paths values by their parent directory relative to contex.work_dir.
 # Returns a sorted rel_parent: [file names] map.
 
-    file_absolute_paths: List[str] = [absolute_path for absolute_path in context.selection_paths_map.values() if absolute_path and absolute_path.strip()]
+    file_absolute_paths: List[str] = list(context.selection_paths_map.values()) # Always absolute, as resolved by prepare_workspace.
     root_directory: str = os.path.abspath(context.work_directory)
-    filenames_by_parent_folder: Dict[str, List[str]] = defaultdict(list)
+    parent_filename_pairs: List[Tuple[str, str]] = []
 
     for file_absolute_path in file_absolute_paths:
-        if not os.path.isabs(file_absolute_path):
-            file_absolute_path = os.path.abspath(file_absolute_path)
         try:
-            relative_path: str = os.path.relpath(file_absolute_path, root_directory)
+            relative_path: str = os.path.relpath(file_absolute_path, root_directory).translate(_BACKSLASH_TO_SLASH)
         except Exception:
             continue
-        relative_path: str = relative_path.replace("\\", "/")
-        parent_directory_ = os.path.dirname(relative_path.replace("\\", "/")) or "."
-        filename_ = os.path.basename(relative_path)
-        filenames_by_parent_folder[parent_directory_].append(filename_)
+        parent_directory_, _, filename_ = relative_path.rpartition("/")
+        parent_filename_pairs.append((parent_directory_ or ".", filename_))
+        # Normalizes separators once and splits the parent folder and file name in a single pass.
+
+    parent_filename_pairs.sort()
+    filenames_by_parent_folder: Dict[str, List[str]] = {}
+    for parent_directory, filename in parent_filename_pairs:
+        filenames_by_parent_folder.setdefault(parent_directory, []).append(filename)
+    # A single sort of (parent, file name) pairs orders both the folders and the files within them, so groups are filled already sorted.
 
-    return {parent_directory: sorted(filename) for parent_directory, filename in sorted(filenames_by_parent_folder.items())}
+    return filenames_by_parent_folder
 
 
 def list_initial_files(context: "CPContext" = None, recursive: bool = False, ) -> list[str]:
 # Lists candidate files from input_folder. On Windows returns paths relative to work_dir - where are located the input files.
 # Recursive is not used on Windows.
 
-    source_file_types = ALLOWED_FILE_TYPES + RAW_SOURCE_TYPES
     input_folder: str = context.input_folder if context else ""
 
     if not input_folder:
         if context is not None:
+            context.selection_relative_paths = []
             context.selection_paths_map = {}
         return []
 
@@ -101,35 +124,58 @@ def list_initial_files(context: "CPContext" = None, recursive: bool = False, ) -
     if context is not None:
         context.work_directory = root_directory  # setting context work dir
 
-    relative_paths: list[str] = []
-
-    blocked_directories = {
-        directory_name.strip() for directory_name in (TARGET_FOLDER_NAME, BACKUP_FOLDER_NAME)
-        if directory_name and directory_name.strip()
-    }
-
     if recursive:
-        for root, subdirectories, filenames in os.walk(root_directory):
-            subdirectories[:] = [subdirectory for subdirectory in subdirectories if subdirectory not in blocked_directories]
-            for filename in filenames:
-                if filename.lower().endswith(source_file_types):
-                    absolute_path = os.path.join(root, filename)
-                    relative_path = os.path.relpath(absolute_path, root_directory).replace("\\", "/")
-                    relative_paths.append(relative_path)
+        scanned_source_files: Dict[str, Tuple[str, str]] = _scan_source_files(root_directory)
     else:
-        for filename in os.listdir(root_directory):
-            if filename.lower().endswith(source_file_types):
-                absolute_path = os.path.join(root_directory, filename)
-                if os.path.isfile(absolute_path):
-                    relative_paths.append(filename)
-
-    relative_paths.sort()
-    context.selection_paths_map = {relative_path_: "" for relative_path_ in relative_paths}
-    # Collects relative file paths as keys in the dict, prepare_workspace fills in values as absolute paths.
+        scanned_source_files = {}
+        with os.scandir(root_directory) as entries:
+            for entry in entries:
+                source_file_extension = _lowercase_extension(entry.name)
+                if source_file_extension in SOURCE_FILE_EXTENSIONS and entry.is_file():
+                    scanned_source_files[entry.name] = (entry.path.replace("\\", "/"), source_file_extension)
+
+    if context is not None:
+        context.scanned_source_files = scanned_source_files
+    # Keeps the absolute paths and extensions captured during the scan, so prepare_workspace doesn't derive them again.
+
+    relative_paths: list[str] = list(scanned_source_files)
+    relative_paths.sort(key=str.lower)
+    # Case-insensitive order, matching how file browsers list textures; str.lower runs once per path as the sort key.
+    context.selection_relative_paths = relative_paths
+    context.selection_paths_map = {}
+    # Collects relative file paths, prepare_workspace maps the resolved ones to absolute paths.
     # For compatibility reasons with Engine paths - engine assets need exporting first during prepare_workspace.
     return relative_paths
 
 
+def _scan_source_files(root_directory: str) -> Dict[str, Tuple[str, str]]:
+# Lists source files under the root directory as relative paths mapped to their (absolute path, lowercase extension), skipping the output/backup folders.
+# Walks the folders iteratively; relative paths are built from the accumulated prefix instead of relpath calls.
+# Like os.walk, symlinked files are listed, while symlinked folders aren't descended into.
+
+    source_files: Dict[str, Tuple[str, str]] = {}
+    pending_directories: deque[tuple[str, str]] = deque([(root_directory, "")]) # (absolute directory, relative prefix)
+
+    while pending_directories:
+        directory, relative_prefix = pending_directories.popleft()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if entry.name not in BLOCKED_FOLDER_NAMES and not entry.is_symlink():
+                        pending_directories.append((entry.path, f"{relative_prefix}{entry.name}/"))
+                    continue
+                source_file_extension = _lowercase_extension(entry.name)
+                if source_file_extension in SOURCE_FILE_EXTENSIONS and entry.is_file():
+                    source_files[relative_prefix + entry.name] = (entry.path.replace("\\", "/"), source_file_extension)
+    return source_files
+
+
+def _lowercase_extension(filename: str) -> str:
+# Returns the dotted, lowercase extension; lowercases only the extension rather than the whole name.
+    dot_index = filename.rfind(".")
+    return filename[dot_index:].lower() if dot_index > 0 else ""
+
+
 def prepare_workspace(context: "CPContext" = None) -> None:
 # Resolves each relative path from ctx.selection_paths (keys) to an absolute path under ctx.work_dir (values).
 # Removes entries whose path contains DEST_FOLDER_NAME or BACKUP_FOLDER_NAME to avoid reprocessing output/backup folders.
@@ -137,51 +183,123 @@ def prepare_workspace(context: "CPContext" = None) -> None:
     if not context.work_directory:
         return
 
-    work_directory: str = os.path.abspath(context.work_directory or ".")
-    blocked_folder_names = {folder_name.strip() for folder_name in (TARGET_FOLDER_NAME, BACKUP_FOLDER_NAME) if folder_name and folder_name.strip()}
+    work_directory_prefix: str = os.path.abspath(context.work_directory or ".").replace("\\", "/").rstrip("/") + "/"
+    # Normalized once, so paths of the files not found by the scan are built by concatenation instead of join/abspath per file.
+    raw_source_paths: Dict[str, str] = {} # Relative paths of the .exr files mapped to their absolute paths.
 
-    for relative_path in list(context.selection_paths_map.keys()):
-        path_segments = [path_segment for path_segment in relative_path.split("/") if path_segment]
+    context.selection_paths_map = {}
 
-        if any(path_segment in blocked_folder_names for path_segment in path_segments):
-            context.selection_paths_map.pop(relative_path, None)
-            continue
-        # Skips to avoid reprocessing output/backup folders.
+    for relative_path in context.selection_relative_paths:
+        scanned_source_file: Optional[Tuple[str, str]] = context.scanned_source_files.get(relative_path)
+        if scanned_source_file is not None:
+            absolute_path, source_file_extension = scanned_source_file
+        # Files found by list_initial_files already have their absolute path and extension, and output/backup folders were skipped during the scan.
+
+        else:
+            path_segments = [path_segment for path_segment in relative_path.split("/") if path_segment]
 
-        absolute_path = os.path.abspath(os.path.join(work_directory, relative_path)).replace("\\", "/")
-        source_file_extension = os.path.splitext(absolute_path)[1].lower()
+            if not BLOCKED_FOLDER_NAMES.isdisjoint(path_segments):
+                continue
+            # Skips to avoid reprocessing output/backup folders.
 
+            absolute_path = work_directory_prefix + "/".join(path_segments)
+            source_file_extension = _lowercase_extension(path_segments[-1]) if path_segments else ""
 
         if source_file_extension in RAW_SOURCE_TYPES:
-            if check_exr_libraries():
-                output_path = convert_exr_to_image(absolute_path, file_extension= context.export_extension, delete_source_files= False, srgb_transform = EXR_SRGB_CURVE)
-                if output_path:
-                    context.selection_paths_map[relative_path] = output_path
-                    context.textures_converted_from_raw[output_path] = ConvertedEXRImage(source_exr_path=absolute_path) # Mapping the temporary converted files, for logs and to be later deleted during the cleanup.
-                else:
-                    context.selection_paths_map.pop(relative_path, None)
-                    log(f"Skipping '{absolute_path}': cannot convert EXR to {context.export_extension}.", "error")
-            else:
-                context.selection_paths_map.pop(relative_path, None)
-                log(f"Skipping '{absolute_path}': EXR runtime missing (OpenEXR/NumPy).", "warn")
+            raw_source_paths[relative_path] = absolute_path
             continue
-        # Pre-processing the .exr files.
+        # Collects the .exr files to be converted in parallel.
 
         context.selection_paths_map[relative_path] = absolute_path
 
 
-def save_generated_texture(image: ImageObject, output_directory: str, filename: str, packing_mode_name: str, context: Optional["CPContext"]) -> None:
-# On Windows just saves to out_dir.
+# Pre-processing the .exr files:
+    if not raw_source_paths:
+        return
+
+    if not check_exr_libraries():
+        for absolute_path in raw_source_paths.values():
+            log(f"Skipping '{absolute_path}': EXR runtime missing (OpenEXR/NumPy).", "warn")
+        return
+
+    _prefetch_files(raw_source_paths.values())
+    # The reads of the queued files start in the background, while the first ones are being decoded.
+
+    output_paths = get_worker_pool().map(
+        lambda source_path: convert_exr_to_image(source_path, file_extension= context.export_extension, delete_source_files= False, srgb_transform = EXR_SRGB_CURVE),
+        raw_source_paths.values(),
+    )
+    # Decoding and encoding release the GIL, so conversions of separate files overlap.
+
+    for (relative_path, absolute_path), output_path in zip(raw_source_paths.items(), output_paths):
+        if output_path:
+            context.selection_paths_map[relative_path] = output_path
+            context.textures_converted_from_raw[output_path] = ConvertedEXRImage(source_exr_path=absolute_path) # Mapping the temporary converted files, for logs and to be later deleted during the cleanup.
+        else:
+            log(f"Skipping '{absolute_path}': cannot convert EXR to {context.export_extension}.", "error")
+    # Results are collected in the submission order, so the context is updated from the main thread only.
+
+
+def _prefetch_files(paths: Iterable[str]) -> None:
+# Asks the OS to start reading the files into the page cache without waiting for it (POSIX_FADV_WILLNEED); does nothing on Windows.
+
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for path in paths:
+        try:
+            file_descriptor = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(file_descriptor, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(file_descriptor)
+
+
+def save_generated_texture(image: ImageObject, output_directory: str, filename: str, packing_mode_name: str, context: Optional["CPContext"]) -> Optional[Future]:
+# On Windows just saves to out_dir, on a background thread, so encoding overlaps with packing the next texture; the image is closed once saved.
+# Returns the pending save, resolving to False if saving failed.
 # Packing_mode_name and context are used only in the Unreal version.
+# Output_directory must already exist - it's created once per folder by make_output_dirs, rather than on every save.
 
-    os.makedirs(output_directory, exist_ok=True)
-    output_extension = (getattr(context, "export_ext", "") or "png").lstrip(".").lower() if context else "png"
+    output_extension: str = context.export_extension if context else "png" # Already validated, lowercase and without the dot.
     output_path = os.path.join(output_directory, f"{filename}.{output_extension}")
+
+    _save_slots.acquire()
+    # Blocks when too many images are waiting to be saved, so the packing doesn't run too far ahead of the encoding.
+    try:
+        future: Future = get_worker_pool().submit(_save_and_close, image, output_path, get_captured_log_lines())
+    except Exception:
+        _save_slots.release()
+        raise
+    # Save errors are logged into the same lines as the rest of the texture's logs.
+    future.add_done_callback(lambda _: _save_slots.release())
+    if context is not None:
+        context.pending_saves.append(future)
+    return future
+
+
+def _save_and_close(image: ImageObject, output_path: str, log_lines: Optional[List[str]] = None) -> bool:
+    capture_logs(log_lines)
     try:
         save_image_file(image, output_path)
         return True
-    except Exception:
+    except Exception as error:
+        log(f"Failed to save '{output_path}': {error}", "error")
         return False
+    finally:
+        close_image(image)
+        capture_logs(None)
+
+
+def finish_saving(context: Optional["CPContext"]) -> None:
+# Waits until all generated textures are saved.
+
+    if context is not None:
+        wait(context.pending_saves)
+        context.pending_saves.clear()
 
 
 def move_used_map(source_path: str, backup_directory: Optional[str], context: Optional["CPContext"]) -> None:
@@ -194,70 +312,91 @@ def move_used_map(source_path: str, backup_directory: Optional[str], context: Op
     try:
         if not source_path or not os.path.exists(source_path):
             return
-
-        os.makedirs(backup_directory, exist_ok=True)
-
-        filename = os.path.basename(source_path)
-        target_path = os.path.join(backup_directory, filename)
-
-
-        if os.path.exists(target_path):
-            filename, file_extension = os.path.splitext(filename)
-            i = 2
-            while True:
-                alternative_path = os.path.join(backup_directory, f"{filename}_{i}{file_extension}")
-                if not os.path.exists(alternative_path):
-                    target_path = alternative_path
-                    break
+        # Backup_directory is already created by make_output_dirs.
+
+        backup_filenames: Set[str] = _backup_directory_listing.get(backup_directory)
+        if backup_filenames is None:
+            backup_filenames = _backup_directory_listing[backup_directory] = {os.path.normcase(existing_filename) for existing_filename in os.listdir(backup_directory)}
+        # Lists the backup folder only once per run; names are then checked in memory instead of probing the disk (case-insensitively on Windows).
+
+        original_filename = os.path.basename(source_path)
+        name, file_extension = os.path.splitext(original_filename)
+        filename, i = original_filename, 2
+        while True:
+            while os.path.normcase(filename) in backup_filenames:
+                filename = f"{name}_{i}{file_extension}"
                 i += 1
+            target_path = os.path.join(backup_directory, filename)
+            if not os.path.lexists(target_path):
+                break
+            backup_filenames.add(os.path.normcase(filename))
         # Adds suffixes in case same named files end up in the directory.
+        # The chosen name is checked on disk once before moving, as os.replace overwrites an existing file, e.g., one added to the folder after it was listed.
 
-        shutil.move(source_path, target_path)
+        try:
+            os.replace(source_path, target_path)
+        except OSError as error:
+            if error.errno != errno.EXDEV:
+                raise
+            shutil.move(source_path, target_path)
+        # Renames the file in a single call; copies it only if the backup folder is on a different volume.
+        backup_filenames.add(os.path.normcase(filename))
 
     except Exception as error:
+        _backup_directory_listing.pop(backup_directory, None)
+        # The listing may be out of date; it's read again on the next move.
         log(f"Warning: failed to move '{source_path}' to '{backup_directory}': {error}", "warn")
 
 
 def cleanup(context: "CPContext") -> None:
-# On Windows only deletes the files used for the generation if set in config.
-
-# Deleting temporary files from .exr conversion.:
-    temporary_paths: set = set(context.textures_converted_from_raw.keys())
-    for path in temporary_paths:
-        if path and os.path.isfile(path):
-            try:
-                os.remove(path)
-            except FileNotFoundError:
-                pass
-            except PermissionError as error:
-                log(f"No permission to remove temp '{path}': {error}", "warn")
-            except OSError as error:
-                log(f"Failed to remove temp '{path}': {error}", "warn")
-
-    if not DELETE_USED:
-        return
+# On Windows only deletes temporary files from .exr conversion, and the files used for the generation if set in config.
 
+    temporary_paths: Set[str] = {path for path in context.textures_converted_from_raw.keys() if path} # Temporary files from .exr conversion.
+    used_paths: Set[str] = set()
 
-# Deleting regular images used for packing:
-    selection_paths: Dict[str, str] = context.selection_paths_map
-    for absolute_path in selection_paths.values():
-        if not absolute_path:
-            continue
-        try:
-            if os.path.isfile(absolute_path):
-                os.remove(absolute_path)
-        except FileNotFoundError:
-            pass
-        except PermissionError as error:
-            log(f"No permission to remove '{absolute_path}': {error}", "warn")
-        except OSError as error:
-            log(f"Failed to remove '{absolute_path}': {error}", "warn")
-
-# Deleting original .exr files used for packing:
-    raw_source_paths: Set[ConvertedEXRImage] = {path for path in context.textures_converted_from_raw.values() if path}
-    for raw_source_path in raw_source_paths:
-        if os.path.isfile(raw_source_path):
-            try: os.remove(raw_source_path)
-            except FileNotFoundError: pass
-            except PermissionError as error: log(f"No permission to remove '{raw_source_path}': {error}", "warn")
-            except OSError as error: log(f"Failed to remove '{raw_source_path}': {error}", "warn")
\ No newline at end of file
+    if DELETE_USED:
+        used_paths = set(context.selection_paths_map.values()) # Regular images used for packing.
+        used_paths.update(converted.source_exr_path for converted in context.textures_converted_from_raw.values() if converted and converted.source_exr_path) # Original .exr files used for packing.
+        used_paths -= temporary_paths
+    # Coalesces the paths, so each file is removed only once; converted .exr files are listed both as selection paths and temporary files.
+
+    _backup_directory_listing.clear()
+    # The backup folders are listed anew on the next run, e.g., when run repeatedly from the same Unreal session.
+
+    if temporary_paths or used_paths:
+        worker_pool = get_worker_pool()
+        wait([worker_pool.submit(_remove_file, path, "temp ") for path in temporary_paths] + [worker_pool.submit(_remove_file, path) for path in used_paths])
+    # File removal releases the GIL, so the deletions run concurrently.
+
+    _shutdown_worker_pool()
+
+
+def get_worker_pool() -> ThreadPoolExecutor:
+# Returns the thread pool shared by all the I/O phases, so worker threads are started once per run.
+
+    global _worker_pool
+
+    if _worker_pool is None:
+        _worker_pool = ThreadPoolExecutor(max_workers=_POOL_WORKERS)
+    return _worker_pool
+
+
+def _shutdown_worker_pool() -> None:
+    global _worker_pool
+
+    if _worker_pool is not None:
+        _worker_pool.shutdown(wait=True)
+        _worker_pool = None
+
+
+def _remove_file(path: str, label: str = "") -> None:
+# Removes a single file, skipping the ones that no longer exist, without probing them first.
+
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    except PermissionError as error:
+        log(f"No permission to remove {label}'{path}': {error}", "warn")
+    except OSError as error:
+        log(f"Failed to remove {label}'{path}': {error}", "warn")
@@ -1,4 +1,5 @@
-from typing import Dict, TypedDict, Optional, Tuple, List
+from concurrent.futures import Future
+from typing import Dict, TypedDict, Optional, Set, Tuple, List
 from dataclasses import dataclass, field
 
 
@@ -61,6 +62,27 @@ class ValidModeEntry:
     mode: PackingMode  # Packing mode configuration selected for this set.
     texture_maps_for_mode: TextureMapCollection # Maps required by the mode, filtered for this set.
     packing_mode_suffix: str # Final suffix used in the output filename for this mode (custom or generated).
+    mode_name: str # Packing mode name, read from the mode once, as it's looked up repeatedly during processing.
+    channels: ChannelMapping # Texture map types mapped to the output channels, read from the mode once.
+
+@dataclass(frozen=True)
+class ChannelPlan:
+    output_channel: str # Channel of the generated image, e.g., "R".
+    texture_map_name: str # Texture map name as set in the packing mode, e.g., "Normal.R".
+    base_texture_type: str # Lowercase texture map type without the channel specifier, e.g., "normal".
+    requested_channel: str # Channel taken from an RGB/RGBA source, e.g., "R"; empty if the map is packed as grayscale.
+
+@dataclass
+class PendingTextureSet:
+    texture_set: TextureSet # Texture set whose channel-packed textures are being generated.
+    log_lines: List[str] # Log lines of the set, printed once its textures are generated, so the logs stay in the order of the sets.
+    valid_modes_with_maps: List[ValidModeEntry] = field(default_factory=list) # Modes being generated for the set.
+    generated_textures: List[Future] = field(default_factory=list) # File name created for each mode and its pending save, in the order of the modes.
+    mode_log_lines: List[List[str]] = field(default_factory=list) # Log lines of each mode, collected on the generation threads and added to log_lines once the mode is saved.
+    expected_texture_resolution: Dict[str, Tuple[int, int]] = field(default_factory=dict) # Target resolution for each mode.
+    invalid_mode_names: Set[str] = field(default_factory=set) # Modes skipped due to invalid texture resolutions.
+    invalid_mode_dimensions: Dict[str, Tuple[int, int]] = field(default_factory=dict) # Invalid resolutions of the skipped modes, for logs.
+    summarize: bool = False # Whether the modes summary is printed for the set; False for sets without any applicable mode.
 
 @dataclass
 class TextureSetInfo:
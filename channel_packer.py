@@ -4,24 +4,38 @@
 import os
 import sys
 import re
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from collections import defaultdict
-from typing import Dict, List, Optional, Set, Tuple, Union, cast
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple, Union, cast
 
 
-from backend.image_lib import (ImageObject, close_image, get_image_channels, get_channel,
-                               get_image_mode, get_size, is_grayscale, is_rgb_grayscale, merge_channels, new_image_grayscale, open_image, resize, convert_to_grayscale)
+from backend.image_lib import (ImageObject, close_image, get_backend_version, get_image_channels, get_channel,
+                               get_image_mode, get_size, is_grayscale, load_image, new_image_grayscale, open_image, pack_channels, probe_image_size, resize, convert_to_grayscale)
 
-from backend.texture_classes import (ChannelMapping, MapNameAndResolution, PackingMode, SetEntry,
+from backend.texture_classes import (ChannelMapping, ChannelPlan, MapNameAndResolution, PackingMode, PendingTextureSet, SetEntry,
                                      TextureMapCollection, TextureMapData, TextureSetInfo, TextureSet, ValidModeEntry)
 
 from backend.io_backend import (ConvertedEXRImage, CPContext, context_validate_export_extension, split_by_parent,
-                                list_initial_files, prepare_workspace, save_generated_texture, move_used_map, cleanup)
+                                list_initial_files, prepare_workspace, save_generated_texture, finish_saving, move_used_map, cleanup, get_worker_pool)
 
-from settings import (TextureTypeConfig, ALLOWED_FILE_TYPES, BACKUP_FOLDER_NAME, TARGET_FOLDER_NAME, INPUT_FOLDER, PACKING_MODES, RESIZE_STRATEGY, SHOW_DETAILS, TEXTURE_CONFIG)
+from settings import (TextureTypeConfig, ALLOWED_FILE_TYPES, BACKUP_FOLDER_NAME, TARGET_FOLDER_NAME, IMAGE_BACKEND, INPUT_FOLDER, PACKING_MODES, RESIZE_STRATEGY, SHOW_DETAILS, TEXTURE_CONFIG)
 
 from utils import (check_texture_suffix_mismatch, close_image_files, detect_size_suffix,
-     group_paths_by_folder, is_power_of_two, log, make_output_dirs, match_suffixes, resolution_to_suffix, validate_safe_folder_name)
+     capture_logs, compile_suffix_patterns, flush_logs, group_paths_by_folder, is_power_of_two, log, make_output_dirs, resolution_to_suffix, start_log_buffering, validate_safe_folder_name, write_log_lines)
+
+
+_generation_executor: Optional[ThreadPoolExecutor] = None # Generates the channel-packed textures of multiple sets and modes concurrently; created on first use, shut down once all sets are processed.
+
+TEXTURE_TYPE_SUFFIXES: List[Tuple[str, Tuple[str, ...]]] = [(texture_type.lower(), tuple(suffix.lower() for suffix in config["suffixes"])) for texture_type, config in TEXTURE_CONFIG.items()]
+# Lowercase texture types with their lowercase suffix aliases, derived from settings once instead of for every file name.
+
+TEXTURE_CONFIG_BY_LOWERCASE_NAME: Dict[str, Tuple[str, TextureTypeConfig]] = {texture_type.lower(): (texture_type, config) for texture_type, config in reversed(TEXTURE_CONFIG.items())}
+# Lowercase texture type names mapped to their names as written in settings and their config; keeps the first entry, if the names differ only in case.
+
+_CHANNEL_VALUE_PATTERN: re.Pattern = re.compile(r"([a-z0-9]+)([._]?[rgb]?)$") # Lowercase channel value: a texture type name with an optional channel specifier.
 
 
 
@@ -62,6 +76,10 @@ def channel_packer(input_folder: Optional[str] = None) -> None:
     start_time = time.time()
     packed_any_textures: bool = False
 
+    if SHOW_DETAILS:
+        log(f"Image backend: {get_backend_version()}", "info")
+        # Prints info.
+
 
 # If provided, taking into account the input folder specified via CLI:
     if input_folder:
@@ -88,9 +106,13 @@ def channel_packer(input_folder: Optional[str] = None) -> None:
     processed_file_groups_order: List[str] = [] # Record the processing order of groups so the final "Skipped" logs follow the same sequence.
 
 
+    start_log_buffering()
+    # Logs of each folder are written at once, when the folder is processed.
+
     for relative_parent_path, files_in_group in grouped_files.items():
         final_folder_path: str = work_directory if relative_parent_path == "." else os.path.join(work_directory, relative_parent_path)
         final_folder_path = os.path.abspath(final_folder_path)
+        # Normalized once per folder, so the relative "/"-separated group path doesn't leave mixed separators in the output paths and logs on Windows.
         target_directory, backup_directory = make_output_dirs(final_folder_path, target_folder_name = TARGET_FOLDER_NAME, backup_folder_name = BACKUP_FOLDER_NAME)
     # Creates output and backup folders (if set) per texture set's folder.
 
@@ -106,9 +128,21 @@ def channel_packer(input_folder: Optional[str] = None) -> None:
         raw_textures: Dict[str, TextureSet] = _build_texture_sets(final_folder_path, files_in_group, context = context) # Collecting maps into texture sets data.
         processed_file_groups_order.append(relative_parent_path)
 
+        converted_texture_types_by_set: Dict[str, Set[str]] = defaultdict(set)
+        for converted_texture in context.textures_converted_from_raw.values():
+            if converted_texture.texture_set_name is not None and converted_texture.texture_map_type is not None:
+                converted_texture_types_by_set[converted_texture.texture_set_name].add(converted_texture.texture_map_type)
+        # Groups the map types converted from .exr by their lowercase texture set name once, instead of scanning all conversions for every set.
+
 # Filtering modes to those with at least two required maps, then choosing the target resolution and logging any mismatches.
+        pending_texture_sets: List[PendingTextureSet] = [] # Sets whose textures are being generated, in the processing order.
+
         for texture_set_name, texture_set in raw_textures.items():
             original_texture_set_name: str = texture_set.texture_set_name
+            pending_texture_set = PendingTextureSet(texture_set = texture_set, log_lines = [])
+            pending_texture_sets.append(pending_texture_set)
+            capture_logs(pending_texture_set.log_lines)
+            # Collects the set's logs, as they are printed only once its textures are generated.
 
             texture_name_for_log = f"{log_prefix}{original_texture_set_name}" if log_prefix else original_texture_set_name
             log(f"\nProcessing: {texture_name_for_log}", "info")
@@ -142,43 +176,41 @@ def channel_packer(input_folder: Optional[str] = None) -> None:
                 is_valid, target_resolution = _check_textures_and_pick_target_resolution(
                     texture_maps_for_mode = texture_maps_for_mode,
                     resize_strategy = RESIZE_STRATEGY,
-                    packing_mode_name = packing_mode.mode["mode_name"],
+                    packing_mode_name = packing_mode.mode_name,
                 )
                 # Finds listed textures resolutions and checks if textures have mip friendly power-of-two (2^n) res.
 
                 if not is_valid:
-                    invalid_mode_names_for_set.add(packing_mode.mode["mode_name"])
-                    invalid_resolution_for_summary[packing_mode.mode["mode_name"]] = target_resolution
+                    invalid_mode_names_for_set.add(packing_mode.mode_name)
+                    invalid_resolution_for_summary[packing_mode.mode_name] = target_resolution
                     continue
                 # # Returns mode names whose textures either have an incorrect resolution or are corrupted (reported as 0×0).
 
 
                 textures_to_scale: List[MapNameAndResolution] = _list_textures_to_scale(texture_maps_for_mode, target_resolution) # Lists all textures with mismatched resolutions that need to be scaled before channel packing.
 
-                displayed_global_resolution_warning = _print_warnings(
-                    textures_to_scale,
-                    displayed_global_resolution_warning,
-                    warning_type = "resolution",
-                    target_resolution = target_resolution,
-                )
+                if textures_to_scale:
+                    displayed_global_resolution_warning = _print_warnings(
+                        textures_to_scale,
+                        displayed_global_resolution_warning,
+                        warning_type = "resolution",
+                        target_resolution = target_resolution,
+                    )
                 # Prints warning if textures have different resolution within a single texture set.
 
                 suffix_mismatch_buffer.extend(_check_suffix_warnings_for_set(texture_maps_for_mode))
                 # Lists all files whose size suffix (if available) does not match the actual resolution.
 
-                expected_texture_resolution[packing_mode.mode["mode_name"]] = target_resolution
+                expected_texture_resolution[packing_mode.mode_name] = target_resolution
                 # Sets a target resolution for a given packing mode.
 
 
  # Finalizing modes for a set and printing warnings before generation:
-            ready_packing_modes = [
-                mode for mode in valid_packing_modes_with_maps
-                if mode.mode["mode_name"] not in invalid_mode_names_for_set
-            ]
-            invalid_packing_modes = [
-                mode for mode in valid_packing_modes_with_maps
-                if mode.mode["mode_name"] in invalid_mode_names_for_set
-            ]
+            ready_packing_modes: List[ValidModeEntry] = []
+            invalid_packing_modes: List[ValidModeEntry] = []
+            for mode in valid_packing_modes_with_maps:
+                (invalid_packing_modes if mode.mode_name in invalid_mode_names_for_set else ready_packing_modes).append(mode)
+            # Splits the modes in a single pass.
 
             if not ready_packing_modes:
                 texture_set.completed = True
@@ -192,69 +224,107 @@ def channel_packer(input_folder: Optional[str] = None) -> None:
             else:
                 valid_packing_modes_with_maps = ready_packing_modes
 
-            displayed_global_suffix_warning = _print_warnings(
-                suffix_mismatch_buffer,
-                displayed_global_suffix_warning,
-                warning_type="suffix",
-            )
+            if suffix_mismatch_buffer:
+                displayed_global_suffix_warning = _print_warnings(
+                    suffix_mismatch_buffer,
+                    displayed_global_suffix_warning,
+                    warning_type="suffix",
+                )
             # Prints warning if size suffixes in the file name (if present) do not match the actual texture size
 
 
-            texture_set_name_lower: str = original_texture_set_name.lower()
-            converted_exr_textures_list: List[str] = sorted({selected.texture_type for selected in context.textures_converted_from_raw.values() if selected.texture_set_name == texture_set_name_lower and selected.texture_type is not None})
-
-            _print_warnings(
-                warning_items=converted_exr_textures_list,
-                warning_displayed=False,
-                warning_type="exr_source",
-            )
+            converted_exr_texture_types: Optional[Set[str]] = converted_texture_types_by_set.get(texture_set_name) # Raw_textures keys are already lowercase set names.
+            if converted_exr_texture_types:
+                _print_warnings(
+                    warning_items=sorted(converted_exr_texture_types),
+                    warning_displayed=False,
+                    warning_type="exr_source",
+                )
             # Logs files that were converted from float to 8bit int.
 
 
             for packing_mode in valid_packing_modes_with_maps:
-                channel_mapping: ChannelMapping = packing_mode.mode.get("channels", {})
+                channel_mapping: ChannelMapping = packing_mode.channels
                 missing_textures = _list_missing_texture_maps_for_channel_mapping(channel_mapping, packing_mode.texture_maps_for_mode)
+                if not missing_textures:
+                    continue
 
                 _print_warnings(
                     missing_textures,
                     False,  # Prints only once per mode
                     warning_type="missing_maps",
-                    packing_mode_name=packing_mode.mode.get("mode_name", ""),
+                    packing_mode_name=packing_mode.mode_name,
                 )
              # Prints warning if size suffixes in the file name (if present) do not match the actual texture size.
 
 
 # Generating channel packed texture:
-            for packing_mode in valid_packing_modes_with_maps:
-                filename = _generate_channel_packed_texture(
-                    packing_mode,
-                    expected_texture_resolution,
-                    target_directory,
-                    backup_directory,
-                    context
-                )
-                if filename:
+            pending_texture_set.valid_modes_with_maps = valid_packing_modes_with_maps
+            pending_texture_set.generated_textures, pending_texture_set.mode_log_lines = _submit_channel_packed_textures(valid_packing_modes_with_maps, expected_texture_resolution, target_directory, context)
+            pending_texture_set.expected_texture_resolution = expected_texture_resolution
+            pending_texture_set.invalid_mode_names = invalid_mode_names_for_set
+            pending_texture_set.invalid_mode_dimensions = invalid_resolution_for_summary
+            pending_texture_set.summarize = True
+            # Queues the textures of the set to be generated in the background, while the next sets are validated.
+
+        capture_logs(None)
+
+
+# Collecting the generated textures of each set in the processing order:
+        for pending_texture_set in pending_texture_sets:
+            texture_set = pending_texture_set.texture_set
+            capture_logs(pending_texture_set.log_lines)
+
+            used_map_paths: Dict[str, None] = {} # Ordered and deduplicated paths of the maps used by the generated textures.
+            all_textures_saved: bool = True
+            for packing_mode, generated_texture in zip(pending_texture_set.valid_modes_with_maps, pending_texture_set.generated_textures):
+                generated_filename, pending_save = generated_texture.result()
+                if pending_save is not None and not pending_save.result():
+                    all_textures_saved = False
+                    continue
+                # Textures are saved in the background; a mode counts as generated only once its file is written.
+                if generated_filename:
                     texture_set.processed = True
                     texture_set.completed = True
                     packed_any_textures = True
+                    used_map_paths.update(dict.fromkeys(texture_data.file_path for texture_data in packing_mode.texture_maps_for_mode.values()))
+
+            for mode_log_lines in pending_texture_set.mode_log_lines:
+                pending_texture_set.log_lines.extend(mode_log_lines)
+            # Adds the warnings and errors logged while generating and saving the modes, once they are all saved, so they are printed under their set.
+
+            if backup_directory and all_textures_saved:
+                for used_map_path in used_map_paths:
+                    move_used_map(used_map_path, backup_directory, context)
+            # Moves the used maps only once all the modes of the set are generated, as the same map can be packed by multiple modes.
+            # Keeps them in place if any texture of the set failed to save.
+
+            if pending_texture_set.summarize:
+                _summarize_mode_results(
+                    texture_set.texture_set_name,
+                    valid_packing_modes,
+                    pending_texture_set.valid_modes_with_maps,
+                    pending_texture_set.expected_texture_resolution,
+                    context=context,
+                    invalid_packing_modes=pending_texture_set.invalid_mode_names,
+                    invalid_packing_mode_dimensions=pending_texture_set.invalid_mode_dimensions,
+                    log_prefix=log_prefix
+                )
 
+            capture_logs(None)
+            write_log_lines(pending_texture_set.log_lines)
 
-            _summarize_mode_results(
-                original_texture_set_name,
-                valid_packing_modes,
-                valid_packing_modes_with_maps,
-                expected_texture_resolution,
-                context=context,
-                invalid_packing_modes=invalid_mode_names_for_set,
-                invalid_packing_mode_dimensions=invalid_resolution_for_summary,
-                log_prefix=log_prefix
-            )
+        flush_logs()
+
+    flush_logs(stop_buffering=True)
 
 
 # Printing summary logs for all the processed folders, and cleaning up temporary files:
     if pre_skipped_texture_sets_summary:
         log("", "info")  # Visual separator
-        final_group_summary_order: List[str] = [g for g in processed_file_groups_order if g in pre_skipped_texture_sets_summary] + [g for g in pre_skipped_texture_sets_summary.keys() if g not in processed_file_groups_order]
+        final_group_summary_order: List[str] = [g for g in processed_file_groups_order if g in pre_skipped_texture_sets_summary]
+        listed_groups: Set[str] = set(final_group_summary_order)
+        final_group_summary_order.extend(g for g in pre_skipped_texture_sets_summary if g not in listed_groups)
         # Lists texture sets and their available maps skipped due to missing required maps + textures sets and their maps from folders that produced no successfully packed textures.
 
         for relative_parent_path in final_group_summary_order:
@@ -266,6 +336,10 @@ def channel_packer(input_folder: Optional[str] = None) -> None:
     # Prints skipped only for texture sets that had not enough maps for any of the set channel packing modes.
 
 
+    _shutdown_generation_executor()
+    finish_saving(context)
+    # Waits for the generated textures queued for saving.
+
     log("", "info")  # Visual separator
     log("All processing done.", "complete")
 
@@ -274,21 +348,15 @@ def channel_packer(input_folder: Optional[str] = None) -> None:
         if multiple_file_groups:
             log(f"Packed maps saved to '{TARGET_FOLDER_NAME}' subfolder(s) inside processed folders.", "info")
         else:
-            single_group = next(iter(grouped_files))
-            final_folder_path = work_directory if single_group in (".", "") else os.path.join(work_directory, single_group) # In case the only processed textures were in the subfolder.
-            absolute_target_directory = os.path.abspath(os.path.join(final_folder_path, TARGET_FOLDER_NAME))
-            log(f"Packed maps saved to: {absolute_target_directory}", "info")
-        # For a single group run prints the absolute output path for the only processed folder.
+            log(f"Packed maps saved to: {target_directory}", "info")
+        # For a single group run prints the absolute output path for the only processed folder, as created by make_output_dirs.
 
     if BACKUP_FOLDER_NAME.strip() and packed_any_textures:
         if multiple_file_groups:
             log(f"Source maps moved to backup folder '{BACKUP_FOLDER_NAME}' inside processed folders.", "info")
         else:
-            single_group = next(iter(grouped_files))
-            final_folder_path = work_directory if single_group in (".", "") else os.path.join(work_directory, single_group) # In case the only processed textures were in the subfolder.
-            absolute_backup_directory = os.path.abspath(os.path.join(final_folder_path, BACKUP_FOLDER_NAME))
-            log(f"Source maps moved to: {absolute_backup_directory}", "info")
-        # For a single group run prints the absolute output path for the only processed folder.
+            log(f"Source maps moved to: {backup_directory}", "info")
+        # For a single group run prints the absolute backup path for the only processed folder, as created by make_output_dirs.
     # Displays summary logs for single as well as multiple folders.
 
 
@@ -330,6 +398,17 @@ def _validate_config(resize_strategy: str, context: Optional[CPContext] = None)
         raise SystemExit(1)
     # Raises an error when texture is mapped to alpha, but output file type doesn't support it.
 
+    if output_file_extension == "tga" and IMAGE_BACKEND == "vips" and get_backend_version().startswith("libvips"):
+        log("Aborted: libvips can't save 'tga' files. Change FILE_TYPE to 'png' or set IMAGE_BACKEND to 'pil' and retry.", "error")
+        raise SystemExit(1)
+    # Raises an error when the vips backend would have to write tga, which libvips has no saver for.
+
+
+    if IMAGE_BACKEND not in ("pil", "vips") or (IMAGE_BACKEND == "vips" and not get_backend_version().startswith("libvips")):
+        log(f"Warning: Image backend '{IMAGE_BACKEND}' is unknown or not installed. Defaulting to 'pil'.", "warn")
+        # Prints Warning.
+    # Checks whether the image backend selected in settings is available.
+
 
     resize_strategy: str = (resize_strategy or "").lower()
     if resize_strategy not in ("up", "down"):
@@ -402,22 +481,19 @@ def _validate_packing_modes() -> List[PackingMode]:
                     sys.exit(1)
             # Allows missing channel mapping only for Alpha; otherwise the script stops.
 
-            match: Optional[re.Match[str]] = re.match(r"([a-z0-9]+)([._]?[rgb]?)$", channel_value.strip(), re.IGNORECASE)
-            # Extracts the map name and optional channel suffix using a regex.
+            match: Optional[re.Match[str]] = _CHANNEL_VALUE_PATTERN.match(channel_value.strip().lower())
+            # Extracts the map name and optional channel suffix using a regex; the value is lowercased once, so the pattern is case-sensitive.
 
             if not match:
                 log(f"PACKING_MODE '{packing_mode_name}' invalid syntax in channel '{channel}': {channel_value}", "error")
                 # Prints error.
                 sys.exit(1)
 
-            texture_name: str = match.group(1).lower() # Derives map name.
-            channel_component_specifier: str = match.group(2).lower() # Derives suffix or "".
+            texture_name: str = match.group(1) # Derives map name.
+            channel_component_specifier: str = match.group(2) # Derives suffix or "".
 
-            texture_config: Optional[TextureTypeConfig] = next(
-                (config for texture_type_name, config in TEXTURE_CONFIG.items() if texture_type_name.lower() == texture_name),
-                None
-            )
-            # Returns the first texture type (key and config) that matches the derived map name in TEXTURE_CONFIG.
+            texture_config: Optional[TextureTypeConfig] = TEXTURE_CONFIG_BY_LOWERCASE_NAME.get(texture_name, (None, None))[1]
+            # Returns the texture type config that matches the derived map name in TEXTURE_CONFIG.
 
             if texture_config is None:
                 log(f"PACKING_MODE '{packing_mode_name}' has unknown texture type set in {channel}: {channel_value}", "error")
@@ -468,45 +544,53 @@ def _validate_packing_modes() -> List[PackingMode]:
 
 def _extract_info_from_texture_set_name(file_path_or_asset: str) -> Optional[TextureSetInfo]:
 # Extracts info from the texture's name without opening the file - works with both files on a disc and Unreal's Content Browser paths.
+    return _parse_texture_file_name(os.path.basename(file_path_or_asset))
+
+
+@lru_cache(maxsize=4096)
+def _parse_texture_file_name(file_path: str) -> Optional[TextureSetInfo]:
+# Cached per file name, as every file is parsed once while preselecting the required files and again while building the texture sets. Bounded, as a long-lived host process, e.g., Unreal, keeps it across runs.
 
-    file_path: str = os.path.basename(file_path_or_asset)
     file_name, _ = os.path.splitext(file_path)  # Gets the filename without extension
-    file_name_lower: str = file_name.lower()
     size_suffix: Optional[str] = detect_size_suffix(file_name)
 
 
-    for texture_type, config in TEXTURE_CONFIG.items(): # Derives texture type and size suffixes based on their aliases set in settings.
-        texture_type = texture_type.lower()
-        suffixes_lower = [s.lower() for s in config["suffixes"]]
+    for texture_type, suffixes_lower in TEXTURE_TYPE_SUFFIXES: # Derives texture type and size suffixes based on their aliases set in settings.
         for type_suffix in suffixes_lower:
-            pattern = match_suffixes(file_name_lower, type_suffix, size_suffix or None)
-            if not pattern:
-                continue
-            regex = re.compile(pattern, flags = re.IGNORECASE)
-            match = regex.search(file_name)
-            if not match:
+            for regex in compile_suffix_patterns(type_suffix, size_suffix or None):
+                match = regex.search(file_name)
+                if match:
+                    break
+            else:
                 continue
-            # Tries to match extracted regex (type/size suffix permutation) to match with a file name.
+            # Tries the precompiled regexes (type/size suffix permutations) in order, until one matches the file name.
 
             texture_set_name = file_name[:match.start()].rstrip("_-.") # Texture set name before the found suffix
             return (texture_set_name, texture_type, (size_suffix or "").lower(), file_name)
     return None
 
 
-def _extract_image_data(file_path: str) -> Optional[Tuple[int, int]]:
-# Opens image to derive its actual resolution.
+def _extract_image_data(file_path: str, probe: Optional[Future] = None) -> Optional[Tuple[int, int]]:
+# Reads the image header to derive its actual resolution; takes the result of a probe already queued on the worker pool if given.
     try:
-        image = open_image(file_path)
-        resolution = get_size(image)
-        close_image(image)
-        return resolution
+        return probe.result() if probe is not None else probe_image_size(file_path)
     except (OSError, ValueError) as e:
         log(f"Cannot open image file: {file_path} – {e}", "error")
         return None
 
 
+def _extract_image_data_batch(file_paths: List[str]) -> List[Optional[Tuple[int, int]]]:
+# Derives the resolutions of multiple images concurrently; results are in the order of the given paths.
+
+    if len(file_paths) < 2:
+        return [_extract_image_data(file_path) for file_path in file_paths]
+    probes: List[Future] = [get_worker_pool().submit(probe_image_size, file_path) for file_path in file_paths]
+    return [_extract_image_data(file_path, probe) for file_path, probe in zip(file_paths, probes)]
+    # Errors are logged from the calling thread, in the order of the paths.
+
+
 def _preselect_required_textures(valid_packing_modes: List["PackingMode"], context: "CPContext", ) -> Dict[str, Dict[str, List[str]]]:
-    # Narrows ctx.selection_paths to only the files actually required by the packing modes (keys only; absolute paths values are derived later in prepare_workspace).
+    # Narrows ctx.selection_relative_paths to only the files actually required by the packing modes (absolute paths are derived later in prepare_workspace).
     # Uses a unique texture_id: parent folder + texture set name to avoid file names collisions across folders.
     # On Windows the keys are relative file paths (e.g., "Subdir/T_Tex.png"); in Unreal the keys are package paths (e.g., "/Game/Textures/T_Tex").
     # Returns skipped sets for logging as: [parent folder]: tex set name (file names with original extensions).
@@ -529,12 +613,12 @@ def _preselect_required_textures(valid_packing_modes: List["PackingMode"], conte
     #     "untyped": ["/Game/UI/Logo"]}} # When a texture type can't be determined
 
 
-    packed_textures_suffixes = {_extract_mode_name(mode).upper() for mode in valid_packing_modes if _extract_mode_name(mode)} # Get final suffixes for the created channel packed, to filter out maps that could already be there from previous script run.
+    packed_textures_suffixes: frozenset[str] = frozenset(mode_suffix.upper() for mode_suffix in map(_extract_mode_name, valid_packing_modes) if mode_suffix) # Get final suffixes for the created channel packed, to filter out maps that could already be there from previous script run.
 
 # Collecting all the texture sets and their files into unique grouped sets:
     texture_sets: Dict[str, SetEntry] = {} # Collection of texture sets where key is the unique id derived from textures paths and set names. Contains display_name, recognized map types : lists of file paths, and untyped files.
     pre_skipped_texture_sets: Dict[str, Dict[str, List[str]]] = defaultdict(lambda: defaultdict(list)) # Mapping of textures sets and its texture set, grouped by unique id, listing texture sets skipped due to not having rewired maps for any valid packaging mode.
-    grouped = group_paths_by_folder(context.selection_paths_map.keys())  # Groups file paths by their parent folders relative to the root fodler.
+    grouped = group_paths_by_folder(context.selection_relative_paths)  # Groups file paths by their parent folders relative to the root fodler.
 
     for group_folder, file_paths in grouped.items():
         for key in file_paths:
@@ -564,9 +648,9 @@ def _preselect_required_textures(valid_packing_modes: List["PackingMode"], conte
 
                 entry = texture_sets.get(texture_id)
                 if entry is None: # Creates a texture set entry for every first texture from the same texture set.
-                    entry = SetEntry(display_name = texture_set_name, types = {}, untyped = [])
+                    entry = SetEntry(display_name = texture_set_name, types = defaultdict(list), untyped = [])
                     texture_sets[texture_id] = entry
-                entry["types"].setdefault(texture_type.lower(), []).append(key) # Assigns a texture type, and its file path to a texture set.
+                entry["types"][texture_type].append(key) # Assigns a texture type, and its file path to a texture set; types is a defaultdict(list).
             # Combines all the textures into the sets [types] - if the script was able to derive a texture set from the name, e.g., "Texture_AO.png".
 
             else:
@@ -575,7 +659,7 @@ def _preselect_required_textures(valid_packing_modes: List["PackingMode"], conte
                 texture_id = f"{group_folder}:{texture_set_name.lower()}"
                 entry = texture_sets.get(texture_id)
                 if entry is None:
-                    entry = SetEntry(display_name = texture_set_name, types = {}, untyped = [])
+                    entry = SetEntry(display_name = texture_set_name, types = defaultdict(list), untyped = [])
                     texture_sets[texture_id] = entry
                 entry["untyped"].append(key)
             # List all remaining textures that are not part of any texture set [untyped], e.g., "Texture.png"
@@ -585,6 +669,8 @@ def _preselect_required_textures(valid_packing_modes: List["PackingMode"], conte
 # Collecting required maps for qualifying sets:
     available_required_maps_per_set: Dict[str, Set[str]] = {} # Stores available texture types required for packing modes per texture set.
     skipped_texture_sets: Set[str] = set()
+    required_textures_per_mode: List[Tuple[frozenset[str], int]] = [(frozenset(required_textures), len(required_textures)) for required_textures in map(_required_base_texture_map_types_for_mode, valid_packing_modes)]
+    # Derives the required texture types of each mode once, instead of for every texture set.
 
     for texture_id, entry in texture_sets.items():
         available_tex_types: Set[str] = set(entry["types"].keys()) # Gets all available texture types for a texture set.
@@ -597,10 +683,9 @@ def _preselect_required_textures(valid_packing_modes: List["PackingMode"], conte
         available_required_maps: Set[str] = set() # Required texture types from qualifying modes that are actually present in this set.
         qualifies: bool = False
 
-        for mode in valid_packing_modes:
-            required_textures = _required_base_texture_map_types_for_mode(mode)
-            present_textures = {b for b in required_textures if b in available_tex_types}
-            if (len(required_textures) <= 2 and present_textures == required_textures) or (len(required_textures) > 2 and len(present_textures) >= 2):
+        for required_textures, required_textures_count in required_textures_per_mode:
+            present_textures = required_textures & available_tex_types
+            if (required_textures_count <= 2 and len(present_textures) == required_textures_count) or (required_textures_count > 2 and len(present_textures) >= 2):
                 qualifies = True
                 available_required_maps.update(present_textures)
         # Lets the set pass if it has at least two of this mode’s unique required maps.
@@ -619,40 +704,43 @@ def _preselect_required_textures(valid_packing_modes: List["PackingMode"], conte
         group_folder, _ = texture_id.split(":", 1)
         display_set_name = entry["display_name"]
 
-        display_files: Set[str] = set() # Set of all textures to be displayed "skipped" in logs.
+        display_files: List[str] = [] # All textures to be displayed "skipped" in logs.
         for file_list in entry["types"].values():
-            for file_path in file_list:
-                file_name = file_path.rsplit("/", 1)[-1]
-                display_files.add(file_name)
+            display_files.extend(file_path.rpartition("/")[2] for file_path in file_list)
         # For texture sets that didn't have required maps for any packing mode.
 
-        for file_path in entry["untyped"]:
-            file_name = file_path.rsplit("/", 1)[-1]
-            display_files.add(file_name)
+        display_files.extend(file_path.rpartition("/")[2] for file_path in entry["untyped"])
         # For textures not recognized as texture sets.
 
-        pre_skipped_texture_sets[group_folder][display_set_name] = sorted(display_files, key=str.lower)
+        display_files.sort(key=str.lower)
+        pre_skipped_texture_sets[group_folder][display_set_name] = display_files
+        # Each file is listed under a single type of a set, and a set's files share one folder, so the names are unique without a set.
 
 
 # Updating context selection paths to store only textures actually required for channel_packaging modes:
-    selected_textures_paths: Dict[str, str] = {}
+    selected_textures_paths: List[str] = []
     for texture_id, required_texture_types in available_required_maps_per_set.items():
         entry = texture_sets[texture_id]
         for required_texture in required_texture_types:
-            for file_path in entry["types"].get(required_texture, []):
-                selected_textures_paths[file_path] = ""  # Placeholder values; dict values are absolute paths to each file - created and overridden in "prepare_workspace".
-    context.selection_paths_map = selected_textures_paths
+            selected_textures_paths.extend(entry["types"].get(required_texture, [])) # Absolute paths to each file are resolved later in "prepare_workspace".
+    context.selection_relative_paths = selected_textures_paths
 
 
     return {relative_parent: dict(skipped_texture_sets_names) for relative_parent, skipped_texture_sets_names in pre_skipped_texture_sets.items()}
     # Returns skipped sets for logging.
 
 
-def _required_base_texture_map_types_for_mode(packing_mode: "PackingMode") -> set[str]:
+def _required_base_texture_map_types_for_mode(packing_mode: "PackingMode") -> frozenset[str]:
 # Converts mapped texture types from dict into a set of required texture types.
 
     channels = (packing_mode.get("channels") or {})
-    return {_strip_channel_specifier(channel_value).lower() for channel_value in channels.values() if channel_value}
+    return _required_base_texture_map_types(tuple(channels.values()))
+
+
+@lru_cache(maxsize=None)
+def _required_base_texture_map_types(channel_values: Tuple[Optional[str], ...]) -> frozenset[str]:
+# Cached per channel mapping, as the same modes are checked against every texture set.
+    return frozenset(_strip_channel_specifier(channel_value) for channel_value in channel_values if channel_value)
 
 
 def _present_base_texture_types_for_mode(available_maps: "TextureMapCollection", mode: "PackingMode") -> set[str]:
@@ -664,7 +752,7 @@ def _present_base_texture_types_for_mode(available_maps: "TextureMapCollection",
         mapped_texture_type = channels.get(texture_map)
         if not mapped_texture_type:
             continue
-        base_texture_map_type = _strip_channel_specifier(mapped_texture_type).lower()
+        base_texture_map_type = _strip_channel_specifier(mapped_texture_type)
         if base_texture_map_type in available_maps:
             base_texture_types.add(base_texture_map_type)
     return base_texture_types
@@ -674,24 +762,32 @@ def _build_texture_sets(input_folder: str, initial_files: List[str], *, required
 # Iterates over all given files, extracts texture set name, and collects all its map data.
 
     raw_textures: Dict[str, TextureSet] = {}
+    texture_files: List[Tuple[str, TextureSetInfo]] = [] # Names of the files to be collected, with the info derived from their names.
+    input_folder_prefix: str = os.path.join(input_folder, "") # Joined once; file paths are then built by concatenation.
+    normalized_input_folder_prefix: str = os.path.abspath(input_folder).replace("\\", "/").rstrip("/") + "/" # Same as input_folder_prefix, in the form used for the keys of converted .exr files.
     for file in initial_files:
-        full_path: str = os.path.join(input_folder, file)
-        info_from_texture_set_name = _extract_info_from_texture_set_name(full_path)
+        info_from_texture_set_name = _extract_info_from_texture_set_name(file)
         if not info_from_texture_set_name:
             continue
+        # Parses the name first; files that aren't part of any texture set are never touched on disk.
 
-        texture_set_name, texture_type, declared_suffix, original_filename = info_from_texture_set_name
-
-        texture_set_name_lower: str = texture_set_name.lower()
-
+        texture_set_name, texture_type, _, _ = info_from_texture_set_name
 
         if required_texture_types_by_set is not None:
-            required_textures = required_texture_types_by_set.get(texture_set_name_lower, set())
-            if required_textures and texture_type.lower() not in required_textures:
+            required_textures = required_texture_types_by_set.get(texture_set_name.lower(), set())
+            if required_textures and texture_type not in required_textures:
                 continue
         # Filters only the files that are required for a given packing mode.
 
-        texture_resolution = _extract_image_data(full_path)
+        texture_files.append((file, info_from_texture_set_name))
+
+    full_paths: List[str] = [input_folder_prefix + file for file, _ in texture_files]
+    texture_resolutions: List[Optional[Tuple[int, int]]] = _extract_image_data_batch(full_paths)
+    # Reads the resolutions of all the files at once, so the header reads overlap instead of waiting on the disk one by one.
+
+    for (file, info_from_texture_set_name), full_path, texture_resolution in zip(texture_files, full_paths, texture_resolutions):
+        texture_set_name, texture_type, declared_suffix, original_filename = info_from_texture_set_name
+        texture_set_name_lower: str = texture_set_name.lower()
 
         if texture_set_name_lower not in raw_textures:
             raw_textures[texture_set_name_lower] = TextureSet(texture_set_name=texture_set_name)
@@ -708,24 +804,22 @@ def _build_texture_sets(input_folder: str, initial_files: List[str], *, required
         # Creates a TextureMapData instance extracted by function and add it to the appropriate map type list.
 
         if context is not None and context.textures_converted_from_raw:
-            normalized_full_image_path: str = os.path.abspath(full_path).replace("\\", "/")
+            normalized_full_image_path: str = normalized_input_folder_prefix + file
+            # Converted files are keyed by absolute paths with forward slashes, as listed by the backend; the folder part is normalized once per call, not per file.
             converted_texture: ConvertedEXRImage = context.textures_converted_from_raw.get(normalized_full_image_path)
             if converted_texture is not None:
                 converted_texture.texture_set_name = texture_set_name_lower
 
-                final_texture_type_name: str = texture_type
-                for texture_type_name_from_config in TEXTURE_CONFIG.keys():
-                    if texture_type_name_from_config.lower() == texture_type.lower():
-                        final_texture_type_name = texture_type_name_from_config
-                        break
+                final_texture_type_name: str = TEXTURE_CONFIG_BY_LOWERCASE_NAME.get(texture_type, (texture_type, None))[0]
                 # Makes sure a texture type starts with a capital letter.
 
-                converted_texture.texture_type = final_texture_type_name
+                converted_texture.texture_map_type = final_texture_type_name
         # Collects map types successfully converted from 32bit float.
 
 
-    raw_textures = dict(sorted(raw_textures.items(), key=lambda kv: kv[0]))
-    return raw_textures
+    return {texture_set_name_lower: raw_textures[texture_set_name_lower] for texture_set_name_lower in sorted(raw_textures)}
+    # Sorts only the set name keys; the files are already listed in case-insensitive order, so the keys arrive nearly sorted.
+    # Sorting the files alone doesn't order the sets, e.g., "Rock2_Albedo" is listed before "Rock_Albedo", while "rock" sorts before "rock2".
 
 
 
@@ -734,24 +828,37 @@ def _build_texture_sets(input_folder: str, initial_files: List[str], *, required
 
 def _strip_channel_specifier(name: str) -> str:
     # Removes the channel specifier (e.g., _R, .R) from the texture name and returns the base name in lowercase.
-    return re.sub(r'[._]([rgba])$', '', name, flags=re.IGNORECASE).lower()
+    return (name[:-2] if _get_channel_specifier(name) else name).lower()
+
+
+def _get_channel_specifier(name: str) -> str:
+    # Returns the uppercase channel specified at the end of the texture name (e.g., "Normal_R", "Normal.r" > "R"), or "" if there is none.
+    # A plain string check; equivalent to matching [._]([rgba])$ without the regex overhead.
+    if len(name) >= 2 and name[-2] in "._" and name[-1] in "rgbaRGBA":
+        return name[-1].upper()
+    return ""
 
 
 def _extract_mode_name(packing_mode: PackingMode) -> str:
     # Extracts the packing-mode suffix from the initial letters of each texture type mapped in channels.
     # Or uses the custom suffix if present in the config.
 
-    custom_mode_suffix: str = packing_mode.get("custom_suffix", "").strip()
     channels: ChannelMapping = packing_mode["channels"]
+    return _derive_mode_suffix(packing_mode.get("custom_suffix", ""), tuple(channels.get(channel) for channel in ("R", "G", "B", "A")))
 
+
+@lru_cache(maxsize=None)
+def _derive_mode_suffix(custom_suffix: str, channel_values: Tuple[Optional[str], ...]) -> str:
+# Cached per mode definition, as the suffix is needed for every texture set the mode applies to.
+
+    custom_mode_suffix: str = custom_suffix.strip()
     if custom_mode_suffix:
         return custom_mode_suffix
 
 
     unique_map_types: Set[str] = set() # Stores only unique maps (e.g., "Normal_R", "Normal_G", "Height" > "Normal", "Height").
     derived_prefix: List[str] = []
-    for channel in ["R", "G", "B", "A"]:
-        mapped_texture_type: Optional[str] = channels.get(channel)
+    for mapped_texture_type in channel_values:
         if not mapped_texture_type:
             continue
 
@@ -765,6 +872,12 @@ def _extract_mode_name(packing_mode: PackingMode) -> str:
     return "".join(derived_prefix)
 
 
+def _texture_area(texture: TextureMapData) -> int:
+# Returns the pixel count of the texture, or 0 if its resolution is unknown.
+    resolution = texture.resolution
+    return resolution[0] * resolution[1] if resolution else 0
+
+
 def _get_available_texture_maps_for_packing(mode: PackingMode, available_maps: TextureMapCollection) -> TextureMapCollection:
     # Returns a dict of available map types used in each PackingMode.
     # If a set contains the same map type in multiple resolutions, picks the highest for packing.
@@ -782,7 +895,11 @@ def _get_available_texture_maps_for_packing(mode: PackingMode, available_maps: T
         if base_texture_map_type in available_maps:
             texture_maps_for_type = available_maps[base_texture_map_type]
             if isinstance(texture_maps_for_type, list):
-                max_resolution_texture = max(texture_maps_for_type, key=lambda t: (t.resolution or (0,0))[0] * (t.resolution or (0,0))[1])
+                if len(texture_maps_for_type) == 1:
+                    max_resolution_texture = texture_maps_for_type[0]
+                else:
+                    max_resolution_texture = max(texture_maps_for_type, key=_texture_area)
+                # A single map of the type is the common case, so it's taken without comparing.
             else:
                 max_resolution_texture = texture_maps_for_type
             available_texture_maps[base_texture_map_type] = max_resolution_texture # Picks the largest resolution for the same map type.
@@ -794,11 +911,12 @@ def _get_valid_modes_for_set(original_name: str, available_maps: TextureMapColle
 # Adds only the texture maps used to a packing mode that expects them and also adds its case-sensitive texture set name for easier identification of a processed set during generation of the channel-packed image.
 # Requires at least 2 maps for a packing mode.
     valid_modes_with_maps: List[ValidModeEntry] = []
-    available_texture_types = set(available_maps.keys())
+    available_texture_types = available_maps.keys()
 
     for mode in valid_packing_modes:
-        required_texture_types = _required_base_texture_map_types_for_mode(mode)
-        present_texture_types = required_texture_types & available_texture_types
+        required_texture_types: frozenset[str] = _required_base_texture_map_types_for_mode(mode)
+        present_texture_types: Set[str] = required_texture_types & available_texture_types
+        # The dict keys view is intersected directly, without copying it into a set first.
 
 
         if (len(required_texture_types) <= 2 and present_texture_types != required_texture_types) or (len(required_texture_types) > 2 and len(present_texture_types) < 2):
@@ -813,7 +931,9 @@ def _get_valid_modes_for_set(original_name: str, available_maps: TextureMapColle
                 texture_set_name=original_name,
                 mode=mode,
                 texture_maps_for_mode=texture_maps_for_mode,
-                packing_mode_suffix=_extract_mode_name(mode)
+                packing_mode_suffix=_extract_mode_name(mode),
+                mode_name=mode["mode_name"],
+                channels=mode.get("channels") or {}
             )
         )
     return valid_modes_with_maps
@@ -829,21 +949,31 @@ def _check_textures_and_pick_target_resolution(
 
     mode_name = packing_mode_name or ""
 
-    texture_resolutions: List[Tuple[int, int]] = []
-    texture_count = len(texture_maps_for_mode)
-    for texture in texture_maps_for_mode.values():
-        if texture.resolution is not None:
-            texture_resolutions.append(texture.resolution)
-    # Lists all resolutions.
-
-
-    if not texture_resolutions or len(texture_resolutions) < texture_count:
+    if not texture_maps_for_mode:
         return False, (0, 0)
-    # Skips mode if files are corrupted.
-
 
-    min_resolution = min(texture_resolutions, key=lambda r: r[0] * r[1])
-    max_resolution = max(texture_resolutions, key=lambda r: r[0] * r[1])
+    first_resolution: Optional[Tuple[int, int]] = None
+    min_resolution: Tuple[int, int] = (0, 0)
+    max_resolution: Tuple[int, int] = (0, 0)
+    min_area: float = float("inf")
+    max_area: int = -1
+    all_same_resolution: bool = True
+    for texture in texture_maps_for_mode.values():
+        resolution = texture.resolution
+        if resolution is None:
+            return False, (0, 0)
+        # Skips mode if files are corrupted.
+
+        area: int = resolution[0] * resolution[1]
+        if area < min_area:
+            min_area, min_resolution = area, resolution
+        if area > max_area:
+            max_area, max_resolution = area, resolution
+        if first_resolution is None:
+            first_resolution = resolution
+        elif resolution != first_resolution:
+            all_same_resolution = False
+    # Finds the smallest and largest resolution and whether they all match in a single pass; ties keep the first texture, as min/max would.
 
 
     if not is_power_of_two(min_resolution[0]) or not is_power_of_two(min_resolution[1]):
@@ -851,7 +981,7 @@ def _check_textures_and_pick_target_resolution(
     # Skips a texture set if any texture doesn't have 2^n resolution.
 
 
-    if len(set(texture_resolutions)) == 1:
+    if all_same_resolution:
         return True, min_resolution
     # When all textures have the same resolution.
 
@@ -880,28 +1010,21 @@ def _list_textures_to_scale(
 
 #                                        === Warnings / Logging ===
 
-def _check_suffix_warnings_for_set(maps_for_mode: TextureMapCollection) -> List[MapNameAndResolution]:
+def _check_suffix_warnings_for_set(maps_for_mode: TextureMapCollection) -> Iterator[MapNameAndResolution]:
 # Iterates over all textures required by a packing mode to check whether there is a mismatch between the declared size in the name (if given) and the actual file resolution.
+# Yields the mismatches, so they are collected straight into the caller's buffer without an intermediate list.
 
-    warnings: List[MapNameAndResolution] = []
     for texture in maps_for_mode.values():
         suffix_warning = check_texture_suffix_mismatch(texture)
         if suffix_warning:
-            warnings.append(suffix_warning)
-    return warnings
+            yield suffix_warning
 
 
 def _list_missing_texture_maps_for_channel_mapping(channel_mapping: ChannelMapping, maps_for_mode: TextureMapCollection) -> List[str]:
 # Lists all textures that are missing for a packing mode to be displayed in logs.
-    available_texture_maps_lower: Set[str] = {k.lower() for k in maps_for_mode.keys()}
-    missing_texture_maps: List[str] = []
-    for mapped_texture_type in channel_mapping.values():
-        if not mapped_texture_type:
-            continue
-        base_texture_map_type: str = mapped_texture_type.split(".")[0].lower()
-        if base_texture_map_type not in available_texture_maps_lower:
-            missing_texture_maps.append(base_texture_map_type)
-    return missing_texture_maps
+# The maps_for_mode keys are already lowercase texture types, so they are checked directly instead of building a lowercase copy.
+    return [base_texture_map_type for base_texture_map_type in (_strip_channel_specifier(mapped_texture_type) for mapped_texture_type in channel_mapping.values() if mapped_texture_type)
+            if base_texture_map_type not in maps_for_mode]
 
 
 def _print_warnings(warning_items: Union[List[MapNameAndResolution], List[str]],
@@ -954,11 +1077,9 @@ def _print_warnings(warning_items: Union[List[MapNameAndResolution], List[str]],
                 # Prints info.
         elif warning_type == "missing_maps":
             for miss in warning_items:
-                for original_key in TEXTURE_CONFIG.keys():
-                    if original_key.lower() == miss:
-                        log(f"Default value: {original_key}", "info")
-                        # Prints info.
-                        break
+                if miss in TEXTURE_CONFIG_BY_LOWERCASE_NAME:
+                    log(f"Default value: {TEXTURE_CONFIG_BY_LOWERCASE_NAME[miss][0]}", "info")
+                    # Prints info.
         elif warning_type == "exr_source":
             for texture in warning_items:
                 log(f"Converted: {texture}", "info")
@@ -972,132 +1093,248 @@ def _print_warnings(warning_items: Union[List[MapNameAndResolution], List[str]],
 
 #                                              === Generation ===
 
-def _extract_channel(image: Optional[ImageObject], texture_map_type: str) -> Optional[ImageObject]:
-# Extracts the channel specified by the packing mode from an RGB/RGBA image. E.g., B: Normal_R. > Normal red channel
+@lru_cache(maxsize=None)
+def _build_channel_plans(output_channel_mapping: Tuple[Tuple[str, str], ...]) -> Tuple[ChannelPlan, ...]:
+# Derives the source map type and channel for each output channel, e.g., ("B", "Normal_R") > ChannelPlan("B", "Normal_R", "normal", "R").
+# Depends only on the packing mode's channels, so it's parsed once per mode instead of per texture set.
+    return tuple(ChannelPlan(output_channel, texture_map_name, _strip_channel_specifier(texture_map_name), _get_channel_specifier(texture_map_name))
+                 for output_channel, texture_map_name in output_channel_mapping)
+
+
+def _extract_channel(image: Optional[ImageObject], channel_plan: ChannelPlan) -> Optional[ImageObject]:
+# Converts a source that isn't packed from a specified channel to a single-channel grayscale image. E.g., B: Roughness > Roughness as 8bit grayscale
     if image is None:
         return None
 
-# Preparing grayscale:
     image_mode: str = get_image_mode(image)
-    if is_grayscale(image):
+    if is_grayscale(image) or image_mode in ("RGB", "RGBA"):
         return convert_to_grayscale(image)
-    # If the image type is 8bit grayscale, returns it as-is, otherwise converts the grayscale from 16 to 8 bit.
+    # Converts 16bit grayscale to 8bit and RGB to grayscale.
+
+    log(f"Unsupported image mode '{image_mode}' for '{channel_plan.texture_map_name}'.", "error")
+    return None
 
-    if image_mode in ("RGB", "RGBA"):
-# Preparing RGB images with a specified channel:
-        channel_match = re.search(r'[._]([rgba])$', texture_map_type, re.IGNORECASE)
-        requested_channel: str = channel_match.group(1).upper() if channel_match else ""
-        # Derives the texture type name from PACKING_MODE channel values (e.g., Normal_R).
 
-        image_channels = get_image_channels(image)
-        if requested_channel and requested_channel in image_channels:
-            return get_channel(image, requested_channel)
-        # If the image is RGB/RGBA and the requested channel is valid, extracts that channel.
+def _resolve_channel_source(image: Optional[ImageObject], channel_plan: ChannelPlan) -> Tuple[Optional[ImageObject], str]:
+# Returns the image and its channel to be packed; RGB/RGBA sources with a valid channel specified are passed as-is, so the channel is extracted only while packing.
+# Other sources are extracted into a grayscale image first.
 
+    requested_channel: str = channel_plan.requested_channel
+    if image is not None and requested_channel and get_image_mode(image) in ("RGB", "RGBA") and requested_channel in get_image_channels(image):
+        return image, requested_channel
+    return _extract_channel(image, channel_plan), "L"
 
-# Preparing grayscale images saved as RGB:
-        base_texture_type: str = texture_map_type.split(".", 1)[0].lower()
-        is_texture_grayscale: bool = False
-        for texture_type, config in TEXTURE_CONFIG.items():
-            if texture_type.lower() == base_texture_type:
-                is_texture_grayscale = (config.get("default", ("G", 0))[0] or "").upper() == "G"
-                break
-        # Checks if the set map type should be single channel data only, e.g., "AO".
 
+def _submit_channel_packed_textures(
+    valid_packing_modes_with_maps: List[ValidModeEntry], # Modes ready to be generated for a single texture set.
+    target_resolution: Dict[str, Tuple[int, int]], # Final resolution for each mode, according to RESIZE_STRATEGY from config.
+    target_directory: str, # Absolute path to a folder where textures are generated.
+    context: Optional[CPContext] = None
+) -> Tuple[List[Future], List[List[str]]]: # Returns a future of the file name and pending save of each mode, in the order of the modes, and the log lines of each mode.
+# Queues the modes of a set to be generated on threads - decoding, resizing and merging images release the GIL, so modes of this and the following sets are generated concurrently.
+
+    global _generation_executor
+    if _generation_executor is None:
+        _generation_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+    # Kept separate from the I/O worker pool, as the generated textures are queued for saving on that pool.
+
+    shared_texture_loads: Dict[Tuple[str, Tuple[int, int]], Future] = _submit_shared_texture_loads(valid_packing_modes_with_maps, target_resolution)
+    release_shared_textures: Optional[Callable[[], None]] = _shared_textures_releaser(len(valid_packing_modes_with_maps), list(shared_texture_loads.values())) if shared_texture_loads else None
+    mode_log_lines: List[List[str]] = [[] for _ in valid_packing_modes_with_maps]
+    generated_textures: List[Future] = [_generation_executor.submit(_generate_channel_packed_texture_with_logs, log_lines, packing_mode, target_resolution, target_directory, context,
+                                                                     shared_texture_loads, release_shared_textures)
+                                        for log_lines, packing_mode in zip(mode_log_lines, valid_packing_modes_with_maps)]
+    return generated_textures, mode_log_lines
+
+
+def _generate_channel_packed_texture_with_logs(log_lines: List[str], *args) -> Tuple[str, Optional[Future]]:
+# Generates a texture on a generation thread, collecting its logs into the mode's own list, as the capture of the set's logs is set only on the main thread.
+    capture_logs(log_lines)
+    try:
+        return _generate_channel_packed_texture(*args)
+    finally:
+        capture_logs(None)
 
-        if is_texture_grayscale and image_mode in ("RGB", "RGBA") and "R" in image_channels and "G" in image_channels:
-            try:
-                if is_rgb_grayscale(image):
-                    return get_channel(image, "R")
-            except Exception:
-                pass
-        #  Checks if RGB texture is just a grayscale image saved as RGB instead of L.
 
-        return convert_to_grayscale(image)
-        # Otherwise, converts the image to grayscale as a fallback.
-    else:
-        log(f"Unsupported image mode '{image_mode}' for '{texture_map_type}'.", "error")
-        return None
+def _submit_shared_texture_loads(
+    valid_packing_modes_with_maps: List[ValidModeEntry],
+    target_resolution: Dict[str, Tuple[int, int]]
+) -> Dict[Tuple[str, Tuple[int, int]], Future]: # Returns the loaded image of each shared map, keyed by its path and target resolution.
+# Queues a single load for maps used by more than one mode of the set at the same target resolution, e.g., a normal map packed by two modes, so it's decoded and resized once.
+
+    modes_per_load: Dict[Tuple[str, Tuple[int, int]], int] = defaultdict(int)
+    channels_per_load: Dict[Tuple[str, Tuple[int, int]], Set[str]] = defaultdict(set) # Channels packed from the map by all the modes using it.
+    for packing_mode in valid_packing_modes_with_maps:
+        mode_resolution: Tuple[int, int] = target_resolution.get(packing_mode.mode_name.strip(), (0, 0))
+        channels_needed_per_map: Dict[str, Set[str]] = _channels_needed_per_map(_channel_plans_for_mode(packing_mode)[1])
+        for texture_name, texture_data in packing_mode.texture_maps_for_mode.items():
+            load_key = (texture_data.file_path, mode_resolution)
+            modes_per_load[load_key] += 1
+            channels_per_load[load_key] |= channels_needed_per_map.get(texture_name, set())
+
+    return {load_key: get_worker_pool().submit(_load_texture_map, load_key[0], load_key[1], channels_per_load[load_key])
+            for load_key, mode_count in modes_per_load.items() if mode_count > 1}
+
+
+def _shared_textures_releaser(mode_count: int, shared_texture_loads: List[Future]) -> Callable[[], None]:
+# Returns a function called by each mode of the set once it's done with the shared maps; the last mode closes them before returning its result,
+# so the source files aren't open anymore when the main thread moves them to the backup folder.
+
+    remaining_modes: List[int] = [mode_count]
+    remaining_modes_lock: threading.Lock = threading.Lock()
+
+    def _release() -> None:
+        with remaining_modes_lock:
+            remaining_modes[0] -= 1
+            if remaining_modes[0]:
+                return
+        close_image_files(load.result() for load in shared_texture_loads if load.exception() is None)
+        # Waits for the loads a failed mode didn't collect, so none is left open.
+
+    return _release
+
+
+def _shutdown_generation_executor() -> None:
+    global _generation_executor
+
+    if _generation_executor is not None:
+        _generation_executor.shutdown(wait=True)
+        _generation_executor = None
+
+
+def _channel_plans_for_mode(valid_packing_mode_entry: ValidModeEntry) -> Tuple[str, Tuple[ChannelPlan, ...]]:
+# Returns the output image mode and the source map and channel for each channel of the output image.
+    channels_config = cast(Dict[str, str], valid_packing_mode_entry.channels) # Variable cast due to TypedDict > Dict issue
+    generated_image_mode: str = "RGBA" if channels_config.get("A") else "RGB" # Decides whether the output image should have 3 or 4 channels,
+    return generated_image_mode, _build_channel_plans(tuple((c, channels_config[c]) for c in generated_image_mode))
+
+
+def _channels_needed_per_map(channel_plans: Tuple[ChannelPlan, ...]) -> Dict[str, Set[str]]:
+# Returns the channels packed from each map, e.g., {"normal": {"R", "G"}, "height": {""}}; "" marks a map used as grayscale.
+    channels_needed_per_map: Dict[str, Set[str]] = defaultdict(set)
+    for channel_plan in channel_plans:
+        channels_needed_per_map[channel_plan.base_texture_type].add(channel_plan.requested_channel)
+    return channels_needed_per_map
+
+
+def _owned_images(loaded_textures: Dict[str, Optional[ImageObject]], channels: List[ImageObject], shared_texture_names: Set[str]) -> List[Optional[ImageObject]]:
+# Returns the images opened or created by a single mode, skipping the shared maps, also when passed through as a channel.
+    shared_image_ids: Set[int] = {id(loaded_textures[texture_name]) for texture_name in shared_texture_names if loaded_textures.get(texture_name) is not None}
+    return [image for image in list(loaded_textures.values()) + channels if id(image) not in shared_image_ids]
+
+
+def _load_texture_map(file_path: str, target_resolution: Tuple[int, int], needed_channels: Set[str]) -> ImageObject:
+# Opens a texture map and scales it to the target resolution right after loading, if mismatched resolutions; it's the only resize pass.
+
+    texture = open_image(file_path, draft_size=target_resolution, draft_grayscale=needed_channels == {""})
+    # Lets .jpeg maps larger than the target be decoded at a reduced scale.
+    try:
+        if get_size(texture) != target_resolution:
+            if len(needed_channels) == 1 and get_image_mode(texture) in ("RGB", "RGBA"):
+                needed_channel: str = next(iter(needed_channels))
+                if needed_channel in get_image_channels(texture):
+                    texture_channel = get_channel(texture, needed_channel)
+                    close_image(texture)
+                    texture = texture_channel
+            # If only a single channel of an RGB map is packed, extracts it before resizing, so only that band is resampled.
+            texture_resized = resize(texture, target_resolution)
+            close_image(texture)
+            texture = texture_resized
+        else:
+            load_image(texture)
+        # Decodes the pixels here, so it happens on the loading thread rather than later while packing.
+    except Exception:
+        close_image(texture)
+        raise
+    return texture
 
 
 def _generate_channel_packed_texture(
     valid_packing_mode_entry: ValidModeEntry, # Original name - mode (name, custom_suffix, channels) - maps used for this mode (tex type: [(path, resolution=, suffix, filename, ext)]).
     target_resolution: Dict[str, Tuple[int, int]], # Final resolution for each mode that files are going to be generated to, according to RESIZE_STRATEGY from config.
     target_directory: str, # Absolute path to a folder where textures are generated.
-    backup_directory: Optional[str] = None, # Absolute path to a folder where textures used for generation are moved afterward.
-    context: Optional[CPContext] = None
-) -> Optional[str]: # Returns the file name of created map and texture types that needed to be generated in case of missing.
+    context: Optional[CPContext] = None,
+    shared_texture_loads: Optional[Dict[Tuple[str, Tuple[int, int]], Future]] = None, # Maps loaded once for several modes of the set, keyed by path and target resolution; closed after all those modes.
+    release_shared_textures: Optional[Callable[[], None]] = None # Called once the mode is done with the shared maps; the last mode of the set closes them.
+) -> Tuple[str, Optional[Future]]: # Returns the file name of created map and its pending save, resolving to False if saving failed; None if saved right away.
 
-    packing_mode: PackingMode = valid_packing_mode_entry.mode # Packing mode that is valid due to check for necessary maps earlier.
-    packing_mode_name: str = packing_mode["mode_name"].strip() # Name of packing mode e.g., ARM.
+    packing_mode_name: str = valid_packing_mode_entry.mode_name.strip() # Name of packing mode e.g., ARM.
     texture_maps_for_mode: TextureMapCollection = valid_packing_mode_entry.texture_maps_for_mode # Only maps that are required by the current packing mode and their corresponding data (tex type: [(path, resolution=, suffix, filename, ext)]).
     target_resolution: tuple[int, int] = target_resolution.get(packing_mode_name, (0, 0)) # Setting target resolution for all files during generation.
     missing_texture_maps: List[str] = [] # Lists all texture's set missing maps required for a given packing mode.
     loaded_textures: Dict[str, Optional[ImageObject]] = {} # Stores loaded texture maps by type, e.g., {"Albedo": <PIL.Image.Image image mode=L size=2048x2048>, "Normal": <PIL.Image.Image image mode=RGB size=2048x2048>, "Roughness": None}.
     channels: List[ImageObject] = [] # List of all images collected to generate the final image.
+    channel_sources: List[Tuple[ImageObject, str]] = [] # Source image and its channel used for each channel of the final image.
     packed_texture: Optional[ImageObject] = None # Final generated image.
 
 
 
 # Preparing an output file type:
-    channels_config = cast(Dict[str, str], packing_mode["channels"]) # Variable cast due to TypedDict > Dict issue
-    generated_image_mode: str = "RGBA" if channels_config.get("A") else "RGB" # Decides whether the output image should have 3 or 4 channels,
-    output_channel_mapping: List[Tuple[str, str]] = [(c, channels_config[c]) for c in generated_image_mode] # Builds a list of (channel, texture_name) mappings for the output image.
+    generated_image_mode, channel_plans = _channel_plans_for_mode(valid_packing_mode_entry) # Output image mode, and the source map and channel for each of its channels.
 
     # Output file type
 
 
 # Loading texture maps:
+    channels_needed_per_map: Dict[str, Set[str]] = _channels_needed_per_map(channel_plans)
+    load_futures: Dict[str, Future] = {}
+    shared_texture_names: Set[str] = set() # Maps loaded for several modes, left open for the other modes.
+    for texture_name, texture_data in texture_maps_for_mode.items():
+        shared_texture_load: Optional[Future] = (shared_texture_loads or {}).get((texture_data.file_path, target_resolution))
+        if shared_texture_load is not None:
+            load_futures[texture_name] = shared_texture_load
+            shared_texture_names.add(texture_name)
+        else:
+            load_futures[texture_name] = get_worker_pool().submit(_load_texture_map, texture_data.file_path, target_resolution, channels_needed_per_map.get(texture_name, set()))
+    # Decoding and resizing release the GIL, so the maps of a mode are loaded concurrently on the I/O worker pool.
+
     try:
-        for texture_name, texture_data in texture_maps_for_mode.items():
+        for texture_name, load_future in load_futures.items():
             try:
-                texture = open_image(texture_data.file_path)
-                if get_size(texture) != target_resolution:
-                    texture_resized = resize(texture, target_resolution)
-                    close_image(texture)
-                    texture = texture_resized
-                loaded_textures[texture_name] = texture # Maps image data to corresponding a texture name.
+                loaded_textures[texture_name] = load_future.result() # Maps image data to corresponding a texture name.
             except (OSError, ValueError) as e:
-                log(f"Warning: failed to open '{texture_data.file_path}' ({e}), will use default.", "warn")
+                log(f"Warning: failed to open '{texture_maps_for_mode[texture_name].file_path}' ({e}), will use default.", "warn")
                 # Prints warning.
                 loaded_textures[texture_name] = None
+        # Results are collected in the order of the maps, so the warnings keep that order in the mode's logs.
 
 
-# Scaling all textures to the target size (if mismatched resolutions) and filling in default values if missing any texture maps:
+# Filling in default values if missing any texture maps (loaded maps are already scaled to the target size):
         for texture_name in texture_maps_for_mode.keys():
             target_texture: Optional[ImageObject] = loaded_textures.get(texture_name)
             if target_texture is None:
                 default_map_value: int
-                _ , default_map_value = TEXTURE_CONFIG[texture_name.lower()]["default"] # From the tuple (G/RGB, int), takes only the default fill value.
+                _ , default_map_value = TEXTURE_CONFIG_BY_LOWERCASE_NAME[texture_name.lower()][1]["default"] # From the tuple (G/RGB, int), takes only the default fill value.
                 loaded_textures[texture_name] = new_image_grayscale(target_resolution, default_map_value)
                 missing_texture_maps.append(texture_name)
             # Gets default values for each map type from config and creates a missing map for packing if necessary.
-            elif get_size(target_texture) != target_resolution:
-                loaded_textures[texture_name] = resize(target_texture, target_resolution)
-            # Scales all textures to the target size, if mismatched resolutions.
 
 
 # Collecting images for each final image channel:
-        for _, texture_map_name in output_channel_mapping:
-            base_texture_type: str = texture_map_name.split(".")[0].lower()
+        for channel_plan in channel_plans:
+            base_texture_type: str = channel_plan.base_texture_type
             texture: ImageObject = loaded_textures.get(base_texture_type)
 
             if texture is None:
                 default_map_value: int = 128  # Default fallback, needed for type validation.
-                for texture_type, texture_config in TEXTURE_CONFIG.items():
-                    if texture_type.lower() == base_texture_type:
-                        default_map_value: int = texture_config["default"][1] # Uses default fill value of a corresponding map, e.g., ("RGB", 128)
-                        break
+                if base_texture_type in TEXTURE_CONFIG_BY_LOWERCASE_NAME:
+                    default_map_value = TEXTURE_CONFIG_BY_LOWERCASE_NAME[base_texture_type][1]["default"][1] # Uses default fill value of a corresponding map, e.g., ("RGB", 128)
                 texture = new_image_grayscale(target_resolution, default_map_value)
                 missing_texture_maps.append(base_texture_type)
             # Creates maps with derived default values if missing; case-insensitive.
 
-            mapped_texture_type: ImageObject = _extract_channel(texture, texture_map_name) # Passes a chosen texture map if grayscale, if RGB, then extracts specific channel, derived from .R .G .B in its name.
-            channels.append(mapped_texture_type)
+            channel_source: Tuple[ImageObject, str] = _resolve_channel_source(texture, channel_plan) # Passes a chosen texture map if grayscale, if RGB, then points to a specific channel, derived from .R .G .B in its name.
+            channel_sources.append(channel_source)
+            channels.append(channel_source[0])
 
 
         # Generating the final image:
-        packed_texture = merge_channels(generated_image_mode, channels)
+        packed_texture = pack_channels(generated_image_mode, channel_sources)
+        close_image_files(_owned_images(loaded_textures, channels, shared_texture_names))
+        loaded_textures.clear()
+        channels.clear()
+        channel_sources.clear()
+        # Releases the source maps as soon as they are packed, instead of holding them while waiting for a free save slot.
 
 
 # Saving the file:
@@ -1106,20 +1343,19 @@ def _generate_channel_packed_texture(
         resolution_suffix: str = (f"_{resolution_to_suffix(target_resolution)}" if any(tex.suffix for tex in texture_maps_for_mode.values()) else "") # Only if the original file name also has size suffix.
         filename: str = f"{display_name}_{packing_mode_suffix}{resolution_suffix}"
 
-        save_generated_texture(packed_texture, target_directory, filename, packing_mode_name, context)
-
-
-        if backup_directory:
-            for texture_data in texture_maps_for_mode.values():
-                move_used_map(texture_data.file_path, backup_directory, context)
-        return filename
+        pending_save: Optional[Future] = save_generated_texture(packed_texture, target_directory, filename, packing_mode_name, context)
+        packed_texture = None
+        # The image is closed by the backend once it's saved.
+        return filename, pending_save
 
 
     finally:
-        handles_to_close = list(loaded_textures.values()) + channels
+        handles_to_close = _owned_images(loaded_textures, channels, shared_texture_names)
         if packed_texture is not None:
             handles_to_close.append(packed_texture)
         close_image_files(handles_to_close)
+        if release_shared_textures is not None:
+            release_shared_textures()
     # Safely closes all opened images even if there is an error during image processing. The wrapper has no context manager, otherwise the file handle stays open.
 
 
@@ -1142,6 +1378,10 @@ def _summarize_mode_results(
 
     invalid_mode_names: Set[str] = invalid_packing_modes or set()
     invalid_dimensions: Dict[str, Tuple[int, int]] = invalid_packing_mode_dimensions or {}
+    valid_packing_modes_by_name: Dict[str, ValidModeEntry] = {}
+    for mode_entry in valid_packing_modes_with_maps:
+        valid_packing_modes_by_name.setdefault(mode_entry.mode_name, mode_entry)
+    # Indexes the modes by name once, instead of searching the list for every mode.
 
 
     for mode in valid_packing_modes:
@@ -1161,7 +1401,7 @@ def _summarize_mode_results(
                 # Prints error.
             continue
 
-        valid_packing_mode = next((mode for mode in valid_packing_modes_with_maps if mode.mode["mode_name"] == mode_name), None)
+        valid_packing_mode = valid_packing_modes_by_name.get(mode_name)
         # Skips invalid modes, so they are not logged again in the summary,
 
         if valid_packing_mode:
@@ -36,6 +36,7 @@ TARGET_FOLDER_NAME: str = _config_data.get("DEST_FOLDER_NAME", "created_maps") #
 BACKUP_FOLDER_NAME: str = _config_data.get("BACKUP_FOLDER_NAME", "") # If provided, moves source maps used during generation into a backup folder after creating the channel-packed map.
 EXR_SRGB_CURVE: bool = _as_bool(_config_data.get("EXR_SRGB_CURVE", True)) # If true, applies sRGB gamma transform when converting the .exr, mimicking Photoshop behavior, when converting with gamma 1.0/exposure 0.0
 RESIZE_STRATEGY: str = _config_data.get("RESIZE_STRATEGY", "down") # Specifies how textures are rescaled when resolutions differ within a set: down to the smallest or up to the largest.
+IMAGE_BACKEND: str = (_config_data.get("IMAGE_BACKEND", "pil") or "pil").strip().lower() # Image processing library: "pil" (Pillow) or "vips" (pyvips), if installed.
 PACKING_MODES: list[PackingMode] = _config_data.get("PACKING_MODES", []) # Uses TEXTURE_CONFIG keys for texture maps to be put into channels. The packing mode is skipped if "name": is empty.
 
 SHOW_DETAILS: bool = _as_bool(_config_data.get("SHOW_DETAILS", False)) # Shows details like exact resolution when printing logs.
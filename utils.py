@@ -1,8 +1,11 @@
 
 """ Texture utilities. Separate module to keep compatibility Channel Packer version-agnostic. """
 
+import atexit
 import os
 import re
+import sys
+import threading
 from typing import Dict, Iterable, List, Optional, Set, Tuple, Any
 from collections import defaultdict
 from functools import lru_cache
@@ -12,41 +15,103 @@ from settings import SIZE_SUFFIXES
 
 from backend.texture_classes  import (TextureMapData, MapNameAndResolution)
 
-from backend.image_lib import (close_image, from_array_u8)
+from backend.image_lib import (close_image, from_array_u8, save_image)
 
 
 LOG_TYPES: list[str] = ["info", "warn", "error", "skip", "complete"]
 # Defines log types; the backend handles printing for the Windows CLI and Unreal Engine.
 
+LOG_PREFIXES: Dict[str, str] = {"info": "   ", "warn": "⚠️ ", "error": "⛔ ", "skip": "❌ ", "complete": "✅ "}
+# Print styles:
+# info: 3 whitespaces + message
+# warn: ⚠️ + message
+# error: ⛔ + message
+# skip: ❌ + message
+# complete: ✅ + message
+
+_log_buffer: Optional[List[str]] = None # Lines waiting to be written while buffering is on; None when lines are printed right away.
+_log_lock: threading.Lock = threading.Lock() # Keeps lines logged from worker threads whole and in order.
+_log_capture: threading.local = threading.local() # Per-thread list the log lines are redirected to by capture_logs.
+
+
 def log(message: str, message_kind: LOG_TYPES = "info") -> None:
 # Maps different log types.
-
-    if message == "":
-        print("")
-        return
+# While buffering is on, collects the lines and writes them at once on flush_logs; errors and completions flush the buffer and print immediately.
 
     if message_kind not in LOG_TYPES:
         message_kind = "info"
+    line: str = f"{LOG_PREFIXES[message_kind]}{message}" if message else ""
+
+    captured_lines: Optional[List[str]] = getattr(_log_capture, "lines", None)
+    if captured_lines is not None:
+        captured_lines.append(line)
+        return
+
+    with _log_lock:
+        if _log_buffer is not None:
+            _log_buffer.append(line)
+            if message_kind in ("error", "complete"):
+                _flush_log_buffer()
+            return
+        # The line is written together with the lines buffered before it.
+        print(line)
+
+
+def capture_logs(lines: Optional[List[str]]) -> None:
+# Redirects the log lines of the calling thread into the given list, to be written later with write_log_lines; None restores normal logging.
+# Lets the logs of work that finishes out of order still be printed in order.
+    _log_capture.lines = lines
+
+
+def get_captured_log_lines() -> Optional[List[str]]:
+# Returns the list the log lines of the calling thread are redirected to, or None; lets work handed off to another thread log into the same list.
+    return getattr(_log_capture, "lines", None)
+
+
+def write_log_lines(lines: List[str]) -> None:
+# Writes already formatted log lines, e.g., collected by capture_logs.
+
+    with _log_lock:
+        if _log_buffer is not None:
+            _log_buffer.extend(lines)
+            return
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+        # Writes all the lines in a single call, like the buffer flush.
+
+
+def start_log_buffering() -> None:
+# Starts collecting the log lines instead of printing each one.
+    global _log_buffer
+
+    with _log_lock:
+        if _log_buffer is None:
+            _log_buffer = []
 
-    if message_kind == "info":
-        print(f"   {message}")
-    elif message_kind == "warn":
-        print(f"⚠️ {message}")
-    elif message_kind == "error":
-        print(f"⛔ {message}")
-    elif message_kind == "skip":
-        print(f"❌ {message}")
-    elif message_kind == "complete":
-        print(f"✅ {message}")
-    else:
-        print(message)  # fallback
-
-    # Print styles:
-    # info: 3 whitespaces + message
-    # warn: ⚠️ + message
-    # error: ⛔ + message
-    # skip: ❌ + message
-    # complete: ✅ + message
+
+def flush_logs(stop_buffering: bool = False) -> None:
+# Writes all the collected log lines in a single call; optionally goes back to printing each line right away.
+    global _log_buffer
+
+    with _log_lock:
+        _flush_log_buffer()
+        if stop_buffering:
+            _log_buffer = None
+
+
+def _flush_log_buffer() -> None:
+    if _log_buffer:
+        sys.stdout.write("\n".join(_log_buffer) + "\n")
+        sys.stdout.flush()
+        _log_buffer.clear()
+
+
+atexit.register(flush_logs, True)
+# Writes out any buffered lines if the run ends early.
+
+
+_SUFFIX_SEPARATOR_PATTERN: re.Pattern = re.compile(r"[-_.]")
 
 
 def check_texture_suffix_mismatch(texture: TextureMapData) -> Optional[MapNameAndResolution]:
@@ -55,7 +120,7 @@ def check_texture_suffix_mismatch(texture: TextureMapData) -> Optional[MapNameAn
     if not getattr(texture, "resolution", None):
         return None
     declared_suffix: str = (texture.suffix or "").lower().lstrip("_")
-    declared_suffix = re.split(r"[-_.]", declared_suffix, maxsplit=1)[0]
+    declared_suffix = _SUFFIX_SEPARATOR_PATTERN.split(declared_suffix, maxsplit=1)[0]
     expected_suffix: str = resolution_to_suffix(texture.resolution).lower().lstrip("_")
     if declared_suffix and declared_suffix != expected_suffix:
         return MapNameAndResolution(texture.filename, texture.resolution)
@@ -177,13 +242,9 @@ def convert_exr_to_image(source_exr_path: str, *, file_extension: str = "png", d
         source_filename: tuple[str, str] = os.path.splitext(source_exr_path)
         filename, _ = source_filename
         target_path: str = f"{filename}.{file_extension}" # The final file path.
-        save_kwargs: dict[str, object] = {}
-
-        if file_extension == "jpeg":
-            save_kwargs.setdefault("quality", 95)
-            save_kwargs.setdefault("optimize", True)
+        save_quality: Optional[int] = 95 if file_extension == "jpeg" else None
 
-        generated_image.save(target_path, format=file_extension.upper(), **save_kwargs)
+        save_image(generated_image, target_path, quality=save_quality) # Saved through the backend, so it works with any image library.
 
         if delete_source_files:
             try:
@@ -198,20 +259,27 @@ def convert_exr_to_image(source_exr_path: str, *, file_extension: str = "png", d
         return None
 
 
+_NORMALIZED_SIZE_SUFFIXES: List[str] = sorted([size_suffix.lower() for size_suffix in SIZE_SUFFIXES if size_suffix], key=len, reverse=True)
+# Normalizes tokens to lowercase and sorts by reverse length to avoid shorter tokens matching before longer ones.
+_SIZE_SUFFIX_ALTERNATIVES: str = "|".join(map(re.escape, _NORMALIZED_SIZE_SUFFIXES))
+_SIZE_SUFFIX_PATTERN: re.Pattern = re.compile(r"(?:[\._\-])(" + _SIZE_SUFFIX_ALTERNATIVES + r")$")
+_SIZE_SUFFIX_ALT_PATTERN: re.Pattern = re.compile(r"(?:[\._\-])(" + _SIZE_SUFFIX_ALTERNATIVES + r")(?:-[a-z0-9]+)?(?=[\._\-][a-z0-9]+$)")
+# Compiled once from settings, as every scanned file name is checked for a size suffix.
+
+
+@lru_cache(maxsize=4096)
 def detect_size_suffix(name: str) -> str:
 # Detects size suffixes present in the map name, e.g., "2K"
+# Cached per name, as each file name is checked both while preselecting the files and while parsing it into a texture set. Bounded, as a long-lived host process, e.g., Unreal, keeps it across runs.
 
-    normalized_size_suffixes: List[str] = sorted([size_suffix.lower() for size_suffix in SIZE_SUFFIXES if size_suffix], key=len, reverse=True)
-    # Normalizes tokens to lowercase and sorts by reverse length to avoid shorter tokens matching before longer ones.
-    if not normalized_size_suffixes:
+    if not _NORMALIZED_SIZE_SUFFIXES:
         return ""
-    pattern = r"(?:[\._\-])(" + "|".join(map(re.escape, normalized_size_suffixes)) + r")$"
+    name_lower: str = name.lower()
     # Tries to match suffix variants to the map name
-    matched_suffix: Optional[re.Match[str]] = re.search(pattern, name.lower())
+    matched_suffix: Optional[re.Match[str]] = _SIZE_SUFFIX_PATTERN.search(name_lower)
     if matched_suffix:
         return matched_suffix.group(1)
-    alt_pattern: str = r"(?:[\._\-])(" + "|".join(map(re.escape, normalized_size_suffixes)) + r")(?:-[a-z0-9]+)?(?=[\._\-][a-z0-9]+$)"
-    alt_match: Optional[re.Match[str]] = re.search(alt_pattern, name.lower())
+    alt_match: Optional[re.Match[str]] = _SIZE_SUFFIX_ALT_PATTERN.search(name_lower)
     return alt_match.group(1) if alt_match else ""
     # Returns the captured token e.g., '2k' if able to find one
 
@@ -227,9 +295,9 @@ def group_paths_by_folder(source_paths: Iterable[str]) -> Dict[str, List[str]]:
         if not isinstance(path, str) or not path:
             continue
 
-        normalized_path: str = path.replace("\\", "/")
-        parent_directory = os.path.dirname(normalized_path).replace("\\", "/") or "."
-        paths_by_folder[parent_directory].append(path)
+        parent_directory, _, _ = path.replace("\\", "/").rpartition("/")
+        paths_by_folder[parent_directory or "."].append(path)
+        # A single partition at the last separator, instead of os.path.dirname and a second separator normalization.
     return {folder: sorted(paths) for folder, paths in sorted(paths_by_folder.items(), key=lambda kv: kv[0])}
 
 
@@ -260,24 +328,30 @@ def match_suffixes(name_lower: str, type_suffix: str, size_suffix: str) -> Optio
 # Takes into account different naming conventions, returns the regex pattern that matches one.
 # Type...size, size...type, ...type
 
+    for pattern in compile_suffix_patterns(type_suffix, size_suffix):
+        if pattern.search(name_lower):
+            return pattern.pattern
+    # Returns the first matching pattern string.
+    return None
+
+
+@lru_cache(maxsize=4096)
+def compile_suffix_patterns(type_suffix: str, size_suffix: Optional[str]) -> Tuple[re.Pattern, ...]:
+# Returns the case-insensitive naming convention patterns for the type and size suffix pair, in the order they are tried.
+# Compiled once per suffix pair, as the same pairs are checked against every scanned file name.
+
     separator: str = r"[\_\-\.]"
     middle_text: str = rf"(?:{separator}[A-Za-z0-9]+)?"
+    patterns: List[str] = []
 
     if size_suffix:
-        pattern1: str = rf"{separator}{re.escape(type_suffix)}{middle_text}{separator}{re.escape(size_suffix)}$"  # type ... [middle_text] ... size
-        pattern2: str = rf"{separator}{re.escape(size_suffix)}{middle_text}{separator}{re.escape(type_suffix)}$"  # size ... [middle_text] ... type
+        patterns.append(rf"{separator}{re.escape(type_suffix)}{middle_text}{separator}{re.escape(size_suffix)}$")  # type ... [middle_text] ... size
+        patterns.append(rf"{separator}{re.escape(size_suffix)}{middle_text}{separator}{re.escape(type_suffix)}$")  # size ... [middle_text] ... type
         # Pattern3 = if more variations are necessary.
-        if re.search(pattern1, name_lower):
-            return pattern1
-        if re.search(pattern2, name_lower):
-            return pattern2
-        # Returns the first matching pattern string.
-
-    only_type_suffix: str = rf"{separator}{re.escape(type_suffix)}$"
-    if re.search(only_type_suffix, name_lower):
-        return only_type_suffix
-    # Returns this in case only the type suffix is present.
-    return None
+
+    patterns.append(rf"{separator}{re.escape(type_suffix)}$")
+    # In case only the type suffix is present.
+    return tuple(re.compile(pattern, flags = re.IGNORECASE) for pattern in patterns)
 
 
 def resolution_to_suffix(size: Tuple[int, int]) -> str: